@@ -6,10 +6,13 @@ providing a consistent structure for agent definition and testing.
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from crewai import Agent
 from crewai.tools import BaseTool
@@ -26,22 +29,32 @@ class AgentType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
-    """Configuration for an agent instance."""
+    """
+    Configuration for an agent instance.
+
+    Configs are immutable so default configs can be shared between agents
+    without defensive copies; use ``dataclasses.replace`` to derive a
+    modified config.
+    """
 
     role: str
     goal: str
     backstory: str
     verbose: bool = True
     allow_delegation: bool = False
-    tools: list[BaseTool] = field(default_factory=list)
+    # Immutable default shared by every config; real tools are injected at
+    # runtime by replacing the whole sequence
+    tools: Sequence[BaseTool] = ()
     max_iter: Optional[int] = None
     max_execution_time: Optional[int] = None
     memory: bool = False
+    # CrewAI tool-result cache; repeated identical tool calls within a run
+    # are answered without re-executing the tool
+    cache: bool = True
     step_callback: Optional[callable] = None
     max_rpm: Optional[int] = None
-    max_execution_time: Optional[int] = None
     max_prompt_tokens: Optional[int] = None
     max_completion_tokens: Optional[int] = None
     temperature: Optional[float] = None
@@ -51,6 +64,20 @@ class AgentConfig:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+def _hashable(value: Any) -> Any:
+    """Convert a config value to a hashable equivalent for pool keys."""
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        # Unhashable runtime objects are compared by identity
+        return id(value)
+    return value
+
+
 class BaseAgent(ABC):
     """
     Abstract base class for all Cage AI agents.
@@ -59,6 +86,22 @@ class BaseAgent(ABC):
     configuration, and testing. All agents must inherit from this class.
     """
 
+    __slots__ = (
+        "config",
+        "logger",
+        "agent_type",
+        "crewai_agent",
+        "_initialized",
+        "repo_path",
+        "_pooled",
+    )
+
+    # Pool of initialized agents shared by get_or_create, keyed by
+    # _get_cache_key and evicted least recently used first
+    _agent_cache: ClassVar[OrderedDict[tuple, "BaseAgent"]] = OrderedDict()
+    _agent_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    _AGENT_CACHE_SIZE: ClassVar[int] = 64
+
     def __init__(
         self, config: AgentConfig, logger: Optional[logging.Logger] = None, **kwargs
     ):
@@ -77,14 +120,17 @@ class BaseAgent(ABC):
         self.agent_type = self._get_agent_type()
         self.crewai_agent: Optional[Agent] = None
         self._initialized = False
+        self._pooled = False
 
         # Store repo_path if provided
         self.repo_path = kwargs.get("repo_path")
 
-        # Merge additional kwargs into config
-        for key, value in kwargs.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
+        # Merge additional kwargs into a derived config
+        overrides = {
+            key: value for key, value in kwargs.items() if hasattr(config, key)
+        }
+        if overrides:
+            self.config = replace(config, **overrides)
 
     @abstractmethod
     def _get_agent_type(self) -> AgentType:
@@ -92,7 +138,7 @@ class BaseAgent(ABC):
         pass
 
     @abstractmethod
-    def _get_tools(self) -> list[BaseTool]:
+    def _get_tools(self) -> Sequence[BaseTool]:
         """
         Get the tools for this agent. Must be implemented by subclasses.
 
@@ -125,7 +171,8 @@ class BaseAgent(ABC):
             "backstory": self.config.backstory,
             "verbose": self.config.verbose,
             "allow_delegation": self.config.allow_delegation,
-            "tools": tools,
+            "tools": list(tools),
+            "cache": self.config.cache,
         }
 
         # Add optional parameters only if they are not None
@@ -163,12 +210,79 @@ class BaseAgent(ABC):
         """
         Get the CrewAI agent instance, initializing if necessary.
 
+        The CrewAI agent is built once and reused until the configuration
+        changes (see ``update_config``), so repeated crew builds only pay
+        for an attribute read.
+
         Returns:
             CrewAI Agent instance
         """
-        if not self._initialized:
-            return self.initialize()
-        return self.crewai_agent
+        agent = self.crewai_agent
+        if agent is not None:
+            return agent
+        return self.initialize()
+
+    @classmethod
+    def _get_cache_key(cls, config: AgentConfig) -> tuple:
+        """
+        Get the key identifying interchangeable agent instances.
+
+        Every config field is part of the key. Tools are compared by
+        identity, since they hold runtime state; the pooled agent's config
+        keeps them alive, so their ids are not reused while pooled.
+
+        Args:
+            config: Agent configuration
+
+        Returns:
+            Hashable key for the agent pool
+        """
+        return (cls,) + tuple(
+            (
+                tuple(id(tool) for tool in config.tools)
+                if f.name == "tools"
+                else _hashable(getattr(config, f.name))
+            )
+            for f in fields(config)
+        )
+
+    @classmethod
+    def get_or_create(
+        cls, config: AgentConfig, logger: Optional[logging.Logger] = None
+    ) -> "BaseAgent":
+        """
+        Get a pooled, initialized agent for the configuration.
+
+        Agents built from an equal configuration are reused, so batch runs
+        pay for CrewAI agent construction once per configuration. Pooled
+        agents are shared and must not be reconfigured; see update_config.
+
+        Args:
+            config: Agent configuration
+            logger: Optional logger instance
+
+        Returns:
+            Initialized agent instance
+        """
+        key = cls._get_cache_key(config)
+        with cls._agent_cache_lock:
+            cached = cls._agent_cache.get(key)
+            if cached is not None:
+                cls._agent_cache.move_to_end(key)
+                return cached
+            agent = cls(config, logger=logger)
+            agent.initialize()
+            agent._pooled = True
+            cls._agent_cache[key] = agent
+            if len(cls._agent_cache) > cls._AGENT_CACHE_SIZE:
+                cls._agent_cache.popitem(last=False)
+        return agent
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all pooled agents created by get_or_create."""
+        with cls._agent_cache_lock:
+            cls._agent_cache.clear()
 
     def test_agent(
         self, test_input: str, task_id: Optional[str] = None
@@ -252,14 +366,27 @@ class BaseAgent(ABC):
 
         Args:
             **kwargs: Configuration parameters to update
+
+        Raises:
+            RuntimeError: If the agent is shared through get_or_create
         """
+        if self._pooled:
+            raise RuntimeError(
+                "Pooled agents are shared and cannot be reconfigured; create "
+                "an agent from a derived config instead"
+            )
+
+        overrides = {}
         for key, value in kwargs.items():
             if hasattr(self.config, key):
-                setattr(self.config, key, value)
+                overrides[key] = value
                 self.logger.info(f"Updated {key} to {value}")
             else:
                 self.logger.warning(f"Unknown configuration parameter: {key}")
 
+        if overrides:
+            self.config = replace(self.config, **overrides)
+
         # Reinitialize if agent was already created
         if self._initialized:
             self._initialized = False
@@ -5,9 +5,32 @@ This module defines the Committer agent for handling Git operations
 and creating proper commits with meaningful messages.
 """
 
+from collections.abc import Sequence
+from functools import cache, lru_cache
+from typing import Any
 
 from .base import AgentConfig, AgentType, BaseAgent
 
+# Static backstory shared by every config; kept byte-identical across runs so
+# LLM providers can reuse the cached prompt prefix.
+_BACKSTORY = """You are an expert in version control and Git workflows. You handle
+            all Git operations including staging, committing, and pushing changes. You create
+            clear, descriptive commit messages that follow best practices and provide good
+            audit trails."""
+
+_COMMIT_TEMPLATE = """Commit the changes for task: {task_title}
+
+        Stage all changes and create a proper commit with a meaningful message.
+        Check the working tree status first; if there are no changes, respond with a
+        summary indicating nothing needed to be committed instead of forcing a commit.
+        Update task provenance with commit information."""
+
+
+@lru_cache(maxsize=512)
+def _build_commit_task(task_title: str) -> str:
+    """Render the commit task description for a task title."""
+    return _COMMIT_TEMPLATE.format(task_title=task_title)
+
 
 class CommitterAgent(BaseAgent):
     """
@@ -21,7 +44,7 @@ class CommitterAgent(BaseAgent):
         """Return the agent type."""
         return AgentType.COMMITTER
 
-    def _get_tools(self) -> list:
+    def _get_tools(self) -> Sequence:
         """
         Get the tools for the committer agent.
 
@@ -44,13 +67,10 @@ class CommitterAgent(BaseAgent):
         return AgentConfig(
             role="Committer",
             goal="Handle Git operations and create proper commits with meaningful messages",
-            backstory="""You are an expert in version control and Git workflows. You handle
-            all Git operations including staging, committing, and pushing changes. You create
-            clear, descriptive commit messages that follow best practices and provide good
-            audit trails.""",
+            backstory=_BACKSTORY,
             verbose=True,
             allow_delegation=False,
-            tools=[],  # Will be injected at runtime
+            tools=(),  # Will be injected at runtime
             metadata={
                 "specialization": "version_control",
                 "required_tools": ["GitToolWrapper"],
@@ -75,12 +95,7 @@ class CommitterAgent(BaseAgent):
         Returns:
             Task description for the committer
         """
-        return f"""Commit the changes for task: {task_title}
-
-        Stage all changes and create a proper commit with a meaningful message.
-        Check the working tree status first; if there are no changes, respond with a
-        summary indicating nothing needed to be committed instead of forcing a commit.
-        Update task provenance with commit information."""
+        return _build_commit_task(task_title)
 
     def create_commit_message(
         self, task_title: str, task_id: str, change_summary: str
@@ -137,5 +152,23 @@ class CommitterAgent(BaseAgent):
         ]
 
 
-# Default configuration instance
-committer_config = CommitterAgent.create_default_config()
+@cache
+def get_committer_config() -> AgentConfig:
+    """
+    Get the default committer configuration, building it on first use.
+
+    Returns:
+        Shared default committer configuration
+    """
+    return CommitterAgent.create_default_config()
+
+
+# Agents exported by this module, for AgentRegistry.load_agents_from_module
+__agents__ = [(CommitterAgent, get_committer_config)]
+
+
+def __getattr__(name: str) -> Any:
+    """Provide ``committer_config`` lazily for existing importers (PEP 562)."""
+    if name == "committer_config":
+        return get_committer_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
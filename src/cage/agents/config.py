@@ -8,14 +8,53 @@ configurations from files and environment variables.
 import json
 import logging
 import os
+import sys
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Optional, Union
 
 from .base import AgentConfig
-from .committer import committer_config
-from .implementer import implementer_config
-from .planner import planner_config
-from .reviewer import reviewer_config
+from .committer import get_committer_config
+from .implementer import get_implementer_config
+from .planner import get_planner_config
+from .reviewer import ReviewerAgent
+
+# Factories for the default configurations, keyed by interned lowercase agent
+# name. Configs are built on lookup, so importing this module does not build
+# them; the mapping is shared by every manager and read-only.
+_DEFAULTS: MappingProxyType[str, Callable[[], AgentConfig]] = MappingProxyType(
+    {
+        sys.intern(name): factory
+        for name, factory in {
+            "planner": get_planner_config,
+            "implementer": get_implementer_config,
+            "reviewer": ReviewerAgent.create_default_config,
+            "committer": get_committer_config,
+        }.items()
+    }
+)
+
+# Numeric environment settings as (suffix, coercer); the lowercased suffix is
+# the AgentConfig field name.
+_NUMERIC_ENV_FIELDS = (
+    ("MAX_ITER", int),
+    ("MAX_EXECUTION_TIME", int),
+    ("MAX_RPM", int),
+    ("MAX_PROMPT_TOKENS", int),
+    ("MAX_COMPLETION_TOKENS", int),
+    ("TEMPERATURE", float),
+    ("TOP_P", float),
+    ("FREQUENCY_PENALTY", float),
+    ("PRESENCE_PENALTY", float),
+)
+
+
+@lru_cache(maxsize=32)
+def _env_prefix(normalized_name: str) -> str:
+    """Return the environment variable prefix for a lowercase agent name."""
+    return f"CAGE_AGENT_{normalized_name.upper()}_"
 
 
 class AgentConfigManager:
@@ -38,20 +77,22 @@ class AgentConfigManager:
         """
         self.logger = logger or logging.getLogger(__name__)
         self.config_dir = config_dir or Path("config") / "agents"
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-
-        # Default configurations
-        self._default_configs = {
-            "planner": planner_config,
-            "implementer": implementer_config,
-            "reviewer": reviewer_config,
-            "committer": committer_config,
-        }
+        self._config_dir_str = os.fspath(self.config_dir)
+
+        # The config directory is only created on first write, so read-only
+        # lookups never touch the filesystem for it
+        self._dir_ready = False
 
         self.logger.info(
             f"Agent configuration manager initialized with config dir: {self.config_dir}"
         )
 
+    def _ensure_dir(self) -> None:
+        """Create the configuration directory on first use."""
+        if not self._dir_ready:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
     def get_default_config(self, agent_name: str) -> Optional[AgentConfig]:
         """
         Get the default configuration for an agent.
@@ -62,9 +103,16 @@ class AgentConfigManager:
         Returns:
             Default configuration or None if not found
         """
-        return self._default_configs.get(agent_name.lower())
+        return self._get_default(sys.intern(agent_name.lower()))
 
-    def load_config_from_file(self, config_file: Path) -> Optional[dict[str, Any]]:
+    def _get_default(self, normalized_name: str) -> Optional[AgentConfig]:
+        """Look up a default configuration by already-normalized agent name."""
+        factory = _DEFAULTS.get(normalized_name)
+        return factory() if factory is not None else None
+
+    def load_config_from_file(
+        self, config_file: Union[str, Path]
+    ) -> Optional[dict[str, Any]]:
         """
         Load configuration from a JSON file.
 
@@ -74,17 +122,27 @@ class AgentConfigManager:
         Returns:
             Configuration dictionary or None if failed
         """
+        path = os.fspath(config_file)
         try:
-            with open(config_file) as f:
+            with open(path) as f:
                 config_data = json.load(f)
 
-            self.logger.info(f"Loaded configuration from {config_file}")
+            self.logger.info(f"Loaded configuration from {path}")
             return config_data
 
         except Exception as e:
-            self.logger.error(f"Error loading configuration from {config_file}: {e}")
+            self.logger.error(f"Error loading configuration from {path}: {e}")
             return None
 
+    def _load_file_config(self, agent_name: str) -> Optional[AgentConfig]:
+        """Load an agent's configuration from ``<config_dir>/<name>.json``."""
+        path = f"{self._config_dir_str}/{agent_name}.json"
+        if os.path.exists(path):
+            config_data = self.load_config_from_file(path)
+            if config_data:
+                return AgentConfig(**config_data)
+        return None
+
     def save_config_to_file(self, config: AgentConfig, config_file: Path) -> bool:
         """
         Save configuration to a JSON file.
@@ -113,11 +171,14 @@ class AgentConfigManager:
                 "top_p": config.top_p,
                 "frequency_penalty": config.frequency_penalty,
                 "presence_penalty": config.presence_penalty,
-                "metadata": config.metadata,
+                "metadata": dict(config.metadata),
             }
 
             # Ensure directory exists
-            config_file.parent.mkdir(parents=True, exist_ok=True)
+            if config_file.parent == self.config_dir:
+                self._ensure_dir()
+            else:
+                config_file.parent.mkdir(parents=True, exist_ok=True)
 
             with open(config_file, "w") as f:
                 json.dump(config_data, f, indent=2)
@@ -139,12 +200,22 @@ class AgentConfigManager:
         Returns:
             Agent configuration or None if not found
         """
-        prefix = f"CAGE_AGENT_{agent_name.upper()}_"
+        return self._load_env(agent_name, _env_prefix(agent_name.lower()))
+
+    def _load_env(self, agent_name: str, prefix: str) -> Optional[AgentConfig]:
+        """Load configuration from environment variables under ``prefix``."""
+        # Collect this agent's variables in one pass over the environment,
+        # keyed by the suffix after the prefix
+        env = {
+            key[len(prefix) :]: value
+            for key, value in os.environ.items()
+            if key.startswith(prefix)
+        }
 
         # Get configuration values from environment
-        role = os.getenv(f"{prefix}ROLE")
-        goal = os.getenv(f"{prefix}GOAL")
-        backstory = os.getenv(f"{prefix}BACKSTORY")
+        role = env.get("ROLE")
+        goal = env.get("GOAL")
+        backstory = env.get("BACKSTORY")
 
         if not all([role, goal, backstory]):
             self.logger.warning(
@@ -153,44 +224,19 @@ class AgentConfigManager:
             return None
 
         # Parse boolean values
-        verbose = os.getenv(f"{prefix}VERBOSE", "true").lower() == "true"
-        allow_delegation = (
-            os.getenv(f"{prefix}ALLOW_DELEGATION", "false").lower() == "true"
-        )
-        memory = os.getenv(f"{prefix}MEMORY", "false").lower() == "true"
+        verbose = env.get("VERBOSE", "true").lower() == "true"
+        allow_delegation = env.get("ALLOW_DELEGATION", "false").lower() == "true"
+        memory = env.get("MEMORY", "false").lower() == "true"
 
         # Parse numeric values
-        max_iter = os.getenv(f"{prefix}MAX_ITER")
-        max_iter = int(max_iter) if max_iter else None
-
-        max_execution_time = os.getenv(f"{prefix}MAX_EXECUTION_TIME")
-        max_execution_time = int(max_execution_time) if max_execution_time else None
-
-        max_rpm = os.getenv(f"{prefix}MAX_RPM")
-        max_rpm = int(max_rpm) if max_rpm else None
-
-        max_prompt_tokens = os.getenv(f"{prefix}MAX_PROMPT_TOKENS")
-        max_prompt_tokens = int(max_prompt_tokens) if max_prompt_tokens else None
-
-        max_completion_tokens = os.getenv(f"{prefix}MAX_COMPLETION_TOKENS")
-        max_completion_tokens = (
-            int(max_completion_tokens) if max_completion_tokens else None
-        )
-
-        temperature = os.getenv(f"{prefix}TEMPERATURE")
-        temperature = float(temperature) if temperature else None
-
-        top_p = os.getenv(f"{prefix}TOP_P")
-        top_p = float(top_p) if top_p else None
-
-        frequency_penalty = os.getenv(f"{prefix}FREQUENCY_PENALTY")
-        frequency_penalty = float(frequency_penalty) if frequency_penalty else None
-
-        presence_penalty = os.getenv(f"{prefix}PRESENCE_PENALTY")
-        presence_penalty = float(presence_penalty) if presence_penalty else None
+        numeric = {
+            key.lower(): coerce(value)
+            for key, coerce in _NUMERIC_ENV_FIELDS
+            if (value := env.get(key))
+        }
 
         # Parse metadata
-        metadata_str = os.getenv(f"{prefix}METADATA", "{}")
+        metadata_str = env.get("METADATA", "{}")
         try:
             metadata = json.loads(metadata_str)
         except json.JSONDecodeError:
@@ -202,18 +248,10 @@ class AgentConfigManager:
             backstory=backstory,
             verbose=verbose,
             allow_delegation=allow_delegation,
-            tools=[],  # Tools are injected at runtime
-            max_iter=max_iter,
-            max_execution_time=max_execution_time,
+            tools=(),  # Tools are injected at runtime
             memory=memory,
-            max_rpm=max_rpm,
-            max_prompt_tokens=max_prompt_tokens,
-            max_completion_tokens=max_completion_tokens,
-            temperature=temperature,
-            top_p=top_p,
-            frequency_penalty=frequency_penalty,
-            presence_penalty=presence_penalty,
             metadata=metadata,
+            **numeric,
         )
 
         self.logger.info(f"Loaded configuration for {agent_name} from environment")
@@ -232,33 +270,28 @@ class AgentConfigManager:
         Returns:
             Agent configuration or None if not found
         """
+        normalized_name = sys.intern(agent_name.lower())
+
         if source == "default":
-            return self.get_default_config(agent_name)
+            return self._get_default(normalized_name)
 
         elif source == "file":
-            config_file = self.config_dir / f"{agent_name}.json"
-            if config_file.exists():
-                config_data = self.load_config_from_file(config_file)
-                if config_data:
-                    return AgentConfig(**config_data)
-            return None
+            return self._load_file_config(agent_name)
 
         elif source == "env":
-            return self.load_config_from_env(agent_name)
+            return self._load_env(agent_name, _env_prefix(normalized_name))
 
         elif source == "auto":
             # Try environment first, then file, then default
-            config = self.load_config_from_env(agent_name)
+            config = self._load_env(agent_name, _env_prefix(normalized_name))
             if config:
                 return config
 
-            config_file = self.config_dir / f"{agent_name}.json"
-            if config_file.exists():
-                config_data = self.load_config_from_file(config_file)
-                if config_data:
-                    return AgentConfig(**config_data)
+            config = self._load_file_config(agent_name)
+            if config:
+                return config
 
-            return self.get_default_config(agent_name)
+            return self._get_default(normalized_name)
 
         else:
             self.logger.error(f"Unknown configuration source: {source}")
@@ -274,7 +307,7 @@ class AgentConfigManager:
         configs = []
 
         # Add default configurations
-        configs.extend(self._default_configs.keys())
+        configs.extend(_DEFAULTS.keys())
 
         # Add file-based configurations
         for config_file in self.config_dir.glob("*.json"):
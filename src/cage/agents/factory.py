@@ -6,6 +6,7 @@ dynamically at runtime.
 """
 
 import logging
+from dataclasses import replace
 from typing import Any, Optional, Union
 
 from crewai import Crew, Process, Task
@@ -84,33 +85,9 @@ class AgentFactory:
             self.logger.error(f"Agent '{name}' not found in registry")
             return None
 
-        # Create a new config with overrides
-        config_dict = {
-            "role": base_config.role,
-            "goal": base_config.goal,
-            "backstory": base_config.backstory,
-            "verbose": base_config.verbose,
-            "allow_delegation": base_config.allow_delegation,
-            "tools": base_config.tools,
-            "max_iter": base_config.max_iter,
-            "max_execution_time": base_config.max_execution_time,
-            "memory": base_config.memory,
-            "step_callback": base_config.step_callback,
-            "max_rpm": base_config.max_rpm,
-            "max_prompt_tokens": base_config.max_prompt_tokens,
-            "max_completion_tokens": base_config.max_completion_tokens,
-            "temperature": base_config.temperature,
-            "top_p": base_config.top_p,
-            "frequency_penalty": base_config.frequency_penalty,
-            "presence_penalty": base_config.presence_penalty,
-            "metadata": base_config.metadata.copy(),
-        }
-
-        # Apply overrides
-        config_dict.update(config_overrides)
-
-        # Create new config
-        custom_config = AgentConfig(**config_dict)
+        # Derive a new config with overrides; the base config is immutable
+        # and can be shared, so unchanged fields are aliased rather than copied
+        custom_config = replace(base_config, **config_overrides)
 
         return self.create_agent(name, custom_config, **kwargs)
 
@@ -134,14 +111,8 @@ class AgentFactory:
             self.logger.warning(f"No agents of type '{agent_type.value}' found")
             return []
 
-        agents = []
-        for i in range(min(count, len(agent_names))):
-            agent_name = agent_names[i % len(agent_names)]
-            agent = self.create_agent(agent_name, **kwargs)
-            if agent:
-                agents.append(agent)
-
-        return agents
+        created = (self.create_agent(name, **kwargs) for name in agent_names[:count])
+        return [agent for agent in created if agent]
 
     def create_agent_from_config(
         self, agent_class: type, config: AgentConfig, **kwargs
@@ -168,6 +139,21 @@ class CrewBuilder:
     agent combinations and configurations.
     """
 
+    __slots__ = (
+        "factory",
+        "logger",
+        "_agents",
+        "_tasks",
+        "_process",
+        "_verbose",
+        "_memory",
+        "_planning",
+        "_max_rpm",
+        "_max_execution_time",
+        "_step_callback",
+        "_add_dispatch",
+    )
+
     def __init__(
         self,
         factory: Optional[AgentFactory] = None,
@@ -192,6 +178,10 @@ class CrewBuilder:
         self._max_execution_time: Optional[int] = None
         self._step_callback: Optional[callable] = None
 
+        # add_agent dispatch by input type; anything else is treated as an
+        # agent instance
+        self._add_dispatch = {str: self._resolve_and_append}
+
         self.logger.info("Crew builder initialized")
 
     def add_agent(self, agent: Union[str, BaseAgent]) -> "CrewBuilder":
@@ -204,16 +194,22 @@ class CrewBuilder:
         Returns:
             Self for method chaining
         """
-        if isinstance(agent, str):
-            agent_instance = self.factory.create_agent(agent)
-            if not agent_instance:
-                self.logger.error(f"Failed to create agent '{agent}'")
-                return self
-            agent = agent_instance
+        self._add_dispatch.get(type(agent), self._append_direct)(agent)
+        return self
+
+    def _resolve_and_append(self, name: str) -> None:
+        """Create a registered agent by name and add it to the crew."""
+        agent = self.factory.create_agent(name)
+        if not agent:
+            self.logger.error(f"Failed to create agent '{name}'")
+            return
+        self._append_direct(agent)
 
+    def _append_direct(self, agent: BaseAgent) -> None:
+        """Add an agent instance to the crew."""
         self._agents.append(agent)
-        self.logger.info(f"Added agent '{agent.config.role}' to crew")
-        return self
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Added agent '{agent.config.role}' to crew")
 
     def add_agents(self, agents: list[Union[str, BaseAgent]]) -> "CrewBuilder":
         """
@@ -257,7 +253,8 @@ class CrewBuilder:
             Self for method chaining
         """
         self._tasks.append(task)
-        self.logger.info(f"Added task '{task.description[:50]}...' to crew")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Added task '{task.description[:50]}...' to crew")
         return self
 
     def add_tasks(self, tasks: list[Task]) -> "CrewBuilder":
@@ -381,22 +378,32 @@ class CrewBuilder:
         # Get CrewAI agents
         crewai_agents = [agent.get_agent() for agent in self._agents]
 
-        # Build crew
-        crew = Crew(
-            agents=crewai_agents,
-            tasks=self._tasks,
-            process=self._process,
-            verbose=self._verbose,
-            memory=self._memory,
-            planning=self._planning,
-            max_rpm=self._max_rpm,
-            max_execution_time=self._max_execution_time,
-            step_callback=self._step_callback,
-        )
-
-        self.logger.info(
-            f"Built crew with {len(self._agents)} agents and {len(self._tasks)} tasks"
-        )
+        # Build crew with only the parameters that differ from CrewAI defaults
+        crew_kwargs = {
+            "agents": crewai_agents,
+            "tasks": self._tasks,
+            "process": self._process,
+            "verbose": self._verbose,
+        }
+
+        # Add optional parameters only if they are set
+        if self._memory:
+            crew_kwargs["memory"] = self._memory
+        if self._planning:
+            crew_kwargs["planning"] = self._planning
+        if self._max_rpm is not None:
+            crew_kwargs["max_rpm"] = self._max_rpm
+        if self._max_execution_time is not None:
+            crew_kwargs["max_execution_time"] = self._max_execution_time
+        if self._step_callback is not None:
+            crew_kwargs["step_callback"] = self._step_callback
+
+        crew = Crew(**crew_kwargs)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Built crew with {len(self._agents)} agents and {len(self._tasks)} tasks"
+            )
 
         return crew
 
@@ -407,8 +414,8 @@ class CrewBuilder:
         Returns:
             Self for method chaining
         """
-        self._agents.clear()
-        self._tasks.clear()
+        self._agents = []
+        self._tasks = []
         self._process = Process.sequential
         self._verbose = True
         self._memory = False
@@ -417,7 +424,8 @@ class CrewBuilder:
         self._max_execution_time = None
         self._step_callback = None
 
-        self.logger.info("Crew builder reset")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Crew builder reset")
         return self
 
     def get_agent_info(self) -> list[dict[str, Any]]:
@@ -5,9 +5,50 @@ This module defines the Implementer agent for executing file operations
 and implementing code changes using the Cage Editor Tool.
 """
 
+from collections.abc import Sequence
+from functools import cache
+from typing import Any
 
 from .base import AgentConfig, AgentType, BaseAgent
 
+# Static backstory shared by every config; kept byte-identical across runs so
+# LLM providers can reuse the cached prompt prefix.
+_BACKSTORY = """You are an expert software developer with deep knowledge of
+            code structure, best practices, and implementation patterns. You MUST use the
+            EditorTool for ALL file operations - creating, reading, updating, and deleting files.
+
+            CRITICAL RULES:
+            1. NEVER use terminal commands like 'touch', 'mkdir', 'echo', 'cat', etc.
+            2. ALWAYS use the EditorTool for file operations
+            3. If a file you need to modify does not exist, create it with INSERT (include full content)
+            4. For creating new files, use INSERT operation with full content
+            5. For directories, create files with paths like 'subdir/file.txt'
+            6. Always provide meaningful intent descriptions
+            7. Use proper file extensions (.py, .md, .txt, etc.)
+
+            You carefully execute file operations, making precise changes while maintaining
+            code quality and following established patterns."""
+
+# Static parts of the implementation task description, joined around the
+# per-task title and plan in ImplementerAgent.create_implementation_task.
+_IMPL_TASK_PREFIX = "Execute the implementation plan for task: "
+_IMPL_TASK_MIDDLE = "\n\n        Plan: "
+_IMPL_TASK_SUFFIX = """
+
+        CRITICAL INSTRUCTIONS:
+        1. Use ONLY the EditorTool for all file operations
+        2. Do NOT use terminal commands like 'touch', 'mkdir', 'echo', etc.
+        3. For creating files, use INSERT operation with full content
+        4. For reading files, use GET operation
+        5. For updating files, use UPDATE operation
+        6. For deleting files, use DELETE operation
+        7. Always provide meaningful intent descriptions
+        8. Use proper file extensions (.py, .md, .txt, etc.)
+        9. Combine independent operations (e.g. creating several new files) into
+           one BATCH call
+
+        Be precise and follow the plan exactly using the EditorTool."""
+
 
 class ImplementerAgent(BaseAgent):
     """
@@ -21,7 +62,7 @@ class ImplementerAgent(BaseAgent):
         """Return the agent type."""
         return AgentType.IMPLEMENTER
 
-    def _get_tools(self) -> list:
+    def _get_tools(self) -> Sequence:
         """
         Get the tools for the implementer agent.
 
@@ -44,24 +85,10 @@ class ImplementerAgent(BaseAgent):
         return AgentConfig(
             role="Implementer",
             goal="Execute file operations and implement code changes using the Cage Editor Tool",
-            backstory="""You are an expert software developer with deep knowledge of
-            code structure, best practices, and implementation patterns. You MUST use the
-            EditorTool for ALL file operations - creating, reading, updating, and deleting files.
-
-            CRITICAL RULES:
-            1. NEVER use terminal commands like 'touch', 'mkdir', 'echo', 'cat', etc.
-            2. ALWAYS use the EditorTool for file operations
-            3. If a file you need to modify does not exist, create it with INSERT (include full content)
-            4. For creating new files, use INSERT operation with full content
-            5. For directories, create files with paths like 'subdir/file.txt'
-            6. Always provide meaningful intent descriptions
-            7. Use proper file extensions (.py, .md, .txt, etc.)
-
-            You carefully execute file operations, making precise changes while maintaining
-            code quality and following established patterns.""",
+            backstory=_BACKSTORY,
             verbose=True,
             allow_delegation=False,
-            tools=[],  # Will be injected at runtime
+            tools=(),  # Will be injected at runtime
             metadata={
                 "specialization": "implementation",
                 "required_tools": ["EditorToolWrapper"],
@@ -89,22 +116,34 @@ class ImplementerAgent(BaseAgent):
         Returns:
             Task description for the implementer
         """
-        return f"""Execute the implementation plan for task: {task_title}
+        return "".join(
+            (
+                _IMPL_TASK_PREFIX,
+                task_title,
+                _IMPL_TASK_MIDDLE,
+                plan_content,
+                _IMPL_TASK_SUFFIX,
+            )
+        )
 
-        Plan: {plan_content}
 
-        CRITICAL INSTRUCTIONS:
-        1. Use ONLY the EditorTool for all file operations
-        2. Do NOT use terminal commands like 'touch', 'mkdir', 'echo', etc.
-        3. For creating files, use INSERT operation with full content
-        4. For reading files, use GET operation
-        5. For updating files, use UPDATE operation
-        6. For deleting files, use DELETE operation
-        7. Always provide meaningful intent descriptions
-        8. Use proper file extensions (.py, .md, .txt, etc.)
+@cache
+def get_implementer_config() -> AgentConfig:
+    """
+    Get the default implementer configuration, building it on first use.
 
-        Be precise and follow the plan exactly using the EditorTool."""
+    Returns:
+        Shared default implementer configuration
+    """
+    return ImplementerAgent.create_default_config()
+
+
+# Agents exported by this module, for AgentRegistry.load_agents_from_module
+__agents__ = [(ImplementerAgent, get_implementer_config)]
 
 
-# Default configuration instance
-implementer_config = ImplementerAgent.create_default_config()
+def __getattr__(name: str) -> Any:
+    """Provide ``implementer_config`` lazily for existing importers (PEP 562)."""
+    if name == "implementer_config":
+        return get_implementer_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,48 +5,31 @@ This module defines the Planner agent for creating detailed execution plans
 using Cage-native API endpoints.
 """
 
-from typing import Any, Optional
-
+import asyncio
+import hashlib
+import logging
+import re
+import sqlite3
+import sys
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import closing, contextmanager
+from datetime import datetime
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
+
+from ..utils import json_codec
 from .base import AgentConfig, AgentType, BaseAgent
 
+if TYPE_CHECKING:
+    import numpy as np
 
-class PlannerAgent(BaseAgent):
-    """
-    Planner agent for creating detailed execution plans.
-
-    This agent specializes in analyzing tasks and creating comprehensive,
-    step-by-step plans that break down complex work into manageable,
-    executable steps using Cage-native API endpoints.
-    """
-
-    def _get_agent_type(self) -> AgentType:
-        """Return the agent type."""
-        return AgentType.PLANNER
-
-    def _get_tools(self) -> list:
-        """
-        Get the tools for the planner agent.
-
-        The planner agent doesn't use tools directly - it creates plans
-        that other agents will execute.
-
-        Returns:
-            Empty list (planner doesn't use tools)
-        """
-        return []
-
-    @classmethod
-    def create_default_config(cls) -> AgentConfig:
-        """
-        Create a default configuration for the planner agent.
 
-        Returns:
-            Default agent configuration
-        """
-        return AgentConfig(
-            role="Planner",
-            goal="Create detailed, actionable plans for task execution using Cage-native API endpoints",
-            backstory="""You are an expert software architect and project planner.
+# Prompt text is split into static module-level constants and a dynamic tail.
+# LLM providers only reuse cached prompt prefixes that are byte-identical, so
+# anything task-specific must come after these constants, never inside them.
+_BACKSTORY = """You are an expert software architect and project planner.
             You analyze tasks and create comprehensive, step-by-step plans that break down
             complex work into manageable, executable steps. You consider dependencies,
             risks, and best practices in your planning.
@@ -132,22 +115,453 @@ class PlannerAgent(BaseAgent):
             3. Return the plan JSON content (not the file creation result)
 
             CRITICAL: Return ONLY the JSON object, no markdown formatting, no code blocks, no additional text.
-            """,
+            """
+
+_PLAN_TASK_PREFIX = """Create a detailed Cage-native execution plan that uses only API endpoints:
+        - Use POST /files/edit for all file operations (INSERT, UPDATE, DELETE)
+        - Use GET /files/sha for content validation
+        - Use GET /diff for change validation
+        - Use POST /git/revert for rollback operations
+        - Use POST /runner/exec for optional execution checks
+        - Use POST /git/open_pr for pull request creation
+        - Use POST /tasks/update for task updates
+
+        Include:
+        1. Branch name following convention: chore/task-name-YYYY-MM-DD
+        2. Task-linked commit messages (format given below)
+        3. Validation steps for each operation
+        4. Rollback paths for failure scenarios
+        5. Idempotent operations that can be re-run safely
+
+        Output must be valid JSON following the Cage-native plan schema.
+
+        Plan the following task."""
+
+
+# Matches a whole response wrapped in a ```/```json markdown fence
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+# Cage-native API endpoints a plan may use, shared by every planner config and
+# the plan schema below
+_API_ENDPOINTS: tuple[str, ...] = tuple(
+    sys.intern(endpoint)
+    for endpoint in (
+        "POST /files/edit",
+        "GET /files/sha",
+        "GET /diff",
+        "POST /git/revert",
+        "POST /runner/exec",
+        "POST /git/open_pr",
+        "POST /tasks/update",
+    )
+)
+
+# Structural schema for Cage-native plans, checked before a plan is saved so
+# malformed LLM output is caught here rather than during execution.
+_PLAN_ENDPOINT_PATHS = [
+    sys.intern(endpoint.split(" ", 1)[1]) for endpoint in _API_ENDPOINTS
+]
+
+PLAN_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["taskName", "goal", "branch", "steps"],
+    "properties": {
+        "taskName": {"type": "string"},
+        "taskId": {"type": "string"},
+        "goal": {"type": "string"},
+        "branch": {"type": "string"},
+        "steps": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["name", "request"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "request": {
+                        "type": "object",
+                        "required": ["method", "path"],
+                        "properties": {
+                            "method": {"type": "string"},
+                            "path": {"enum": _PLAN_ENDPOINT_PATHS},
+                            "body": {"type": "object"},
+                        },
+                    },
+                    "validate": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+        },
+    },
+}
+
+
+def _compile_plan_validator(schema: dict[str, Any]) -> Callable[[Any], Any]:
+    """Compile the plan schema with fastjsonschema, falling back to jsonschema."""
+    try:
+        import fastjsonschema
+    except ImportError:
+        from jsonschema import Draft7Validator
+
+        return Draft7Validator(schema).validate
+    return fastjsonschema.compile(schema)
+
+
+_plan_validator = _compile_plan_validator(PLAN_SCHEMA)
+
+
+def validate_plan(plan_data: Any) -> Optional[str]:
+    """
+    Validate a parsed plan against PLAN_SCHEMA.
+
+    Args:
+        plan_data: Parsed plan JSON
+
+    Returns:
+        Error message if the plan is invalid, otherwise None
+    """
+    try:
+        _plan_validator(plan_data)
+    except Exception as e:
+        return getattr(e, "message", None) or str(e)
+    return None
+
+
+def parse_plan_output(result: Any) -> tuple[Any, Optional[str]]:
+    """
+    Parse and validate planner output.
+
+    Args:
+        result: Raw LLM output, optionally wrapped in a markdown code fence
+
+    Returns:
+        Tuple of (plan data, schema error). Output that is not valid JSON
+        is wrapped as ``{"raw_output": ...}`` with no schema error.
+    """
+    text = str(result)
+
+    # LLMs often wrap JSON in a markdown fence despite instructions
+    match = _FENCE_RE.match(text)
+    if match:
+        text = match.group(1)
+
+    try:
+        plan_data = json_codec.loads(text)
+    except json_codec.JSONDecodeError:
+        # If not valid JSON, wrap it
+        return {"raw_output": str(result)}, None
+    return plan_data, validate_plan(plan_data)
+
+
+# Seconds to wait for an embedding before treating the lookup as a miss
+_EMBED_TIMEOUT = 30.0
+
+_embed_loop: Optional[asyncio.AbstractEventLoop] = None
+_embed_loop_lock = threading.Lock()
+
+
+def _get_embed_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop that runs embedding requests.
+
+    The embedding adapter's async client pools connections per event loop,
+    so every request runs on this one long-lived loop; that also works for
+    callers that are themselves inside a running loop.
+    """
+    global _embed_loop
+    with _embed_loop_lock:
+        if _embed_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="plan-cache-embed", daemon=True
+            ).start()
+            _embed_loop = loop
+    return _embed_loop
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_adapter():
+    """Create the configured embedding adapter once, on the embedding loop."""
+    from ..embedding_adapters import make_embedding_adapter
+
+    return make_embedding_adapter()
+
+
+async def _embed_on_loop(text: str) -> list[float]:
+    """Embed a single text; runs on the embedding loop."""
+    result = await _get_embedding_adapter().embed([text])
+    return result["vectors"][0]
+
+
+def _embed_text(text: str) -> list[float]:
+    """Embed a single text with the configured embedding provider."""
+    future = asyncio.run_coroutine_threadsafe(
+        _embed_on_loop(text), _get_embed_loop()
+    )
+    return future.result(timeout=_EMBED_TIMEOUT)
+
+
+class PlanCache:
+    """
+    SQLite-backed cache of generated plans keyed by task embedding.
+
+    Plans are stored with a fingerprint of the task text and a normalized
+    embedding, so a recurring task can reuse its plan instead of calling the
+    LLM again. Only exact matches are reused verbatim; similar plans are
+    retrieved with ``nearest`` and used as a template for the new task, since
+    they name another task's goal and details.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        embed: Optional[Callable[[str], list[float]]] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the plan cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            embed: Optional embedding function (defaults to the configured provider)
+            logger: Optional logger instance
+        """
+        self.db_path = db_path
+        self.logger = logger or logging.getLogger(__name__)
+        self._embed = embed or _embed_text
+
+        # Similarity index over stored embeddings, built lazily on first lookup
+        self._index_plans: Optional[list[str]] = None
+        self._index_vectors: Optional["np.ndarray"] = None
+        self._faiss_index: Any = None
+        # Guards the index, which planner workers share across threads
+        self._index_lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS plan_cache (
+                    fingerprint TEXT PRIMARY KEY,
+                    embedding BLOB,
+                    plan_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )"""
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            with conn:
+                yield conn
+
+    @staticmethod
+    def _fingerprint(text: str) -> str:
+        """Return a stable fingerprint for the task text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def embed(self, text: str) -> Optional["np.ndarray"]:
+        """
+        Embed and L2-normalize the task text.
+
+        Returns:
+            Normalized embedding, or None if no embedding is available
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            # Without numpy (``pip install cage[perf]``) only exact matches
+            # are served; a None embedding skips the similarity lookup
+            return None
+
+        try:
+            vector = np.asarray(self._embed(text), dtype=np.float32)
+        except Exception as e:
+            self.logger.warning("Plan cache embedding failed: %s", e)
+            return None
+
+        norm = np.linalg.norm(vector)
+        if vector.size == 0 or norm == 0:
+            return None
+        return vector / norm
+
+    def _load_index(self) -> None:
+        """
+        Build the in-memory similarity index from the stored embeddings.
+
+        Uses a FAISS inner-product index when faiss is installed, otherwise a
+        numpy matrix; embeddings are normalized, so inner product is cosine.
+        """
+        import numpy as np
+
+        plans: list[str] = []
+        vectors: list[np.ndarray] = []
+        with self._connect() as conn:
+            for plan_json, blob in conn.execute(
+                "SELECT plan_json, embedding FROM plan_cache "
+                "WHERE embedding IS NOT NULL"
+            ):
+                vector = np.frombuffer(blob, dtype=np.float32)
+                if vectors and vector.shape != vectors[0].shape:
+                    continue
+                plans.append(plan_json)
+                vectors.append(vector)
+
+        self._index_plans = plans
+        self._index_vectors = np.vstack(vectors) if vectors else None
+        self._faiss_index = None
+        if self._index_vectors is not None:
+            try:
+                import faiss
+            except ImportError:
+                return
+            self._faiss_index = faiss.IndexFlatIP(self._index_vectors.shape[1])
+            self._faiss_index.add(self._index_vectors)
+
+    def nearest(
+        self, embedding: Optional["np.ndarray"], min_similarity: float
+    ) -> Optional[tuple[str, float]]:
+        """
+        Find the most similar cached plan.
+
+        Args:
+            embedding: Normalized embedding of the task text
+            min_similarity: Minimum cosine similarity to return a match
+
+        Returns:
+            Tuple of (plan JSON, similarity) or None if nothing is close enough
+        """
+        if embedding is None:
+            return None
+
+        try:
+            with self._index_lock:
+                if self._index_plans is None:
+                    self._load_index()
+                plans = self._index_plans
+                vectors = self._index_vectors
+                faiss_index = self._faiss_index
+        except sqlite3.Error as e:
+            self.logger.warning("Plan cache lookup failed: %s", e)
+            return None
+
+        if vectors is None or vectors.shape[1] != embedding.shape[0]:
+            return None
+
+        if faiss_index is not None:
+            scores, ids = faiss_index.search(embedding.reshape(1, -1), 1)
+            best_id, similarity = int(ids[0][0]), float(scores[0][0])
+        else:
+            scores = vectors @ embedding
+            best_id = int(scores.argmax())
+            similarity = float(scores[best_id])
+
+        if best_id < 0 or similarity < min_similarity:
+            return None
+        return plans[best_id], similarity
+
+    def get(self, text: str) -> Optional[str]:
+        """
+        Look up the cached plan for exactly this task text.
+
+        Args:
+            text: Task text used as the cache key
+
+        Returns:
+            The plan JSON, or None on a miss
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT plan_json FROM plan_cache WHERE fingerprint = ?",
+                    (self._fingerprint(text),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning("Plan cache lookup failed: %s", e)
+            return None
+
+        return row[0] if row else None
+
+    def put(
+        self, text: str, embedding: Optional["np.ndarray"], plan_json: str
+    ) -> None:
+        """
+        Store a generated plan for the task text.
+
+        Args:
+            text: Task text used as the cache key
+            embedding: Normalized embedding of the text, if available
+            plan_json: The plan JSON to cache
+        """
+        blob = embedding.astype("float32").tobytes() if embedding is not None else None
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO plan_cache VALUES (?, ?, ?, ?)",
+                    (
+                        self._fingerprint(text),
+                        blob,
+                        plan_json,
+                        datetime.now().isoformat(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning("Plan cache write failed: %s", e)
+            return
+
+        # Rebuild the similarity index on next lookup
+        with self._index_lock:
+            self._index_plans = None
+
+
+class PlannerAgent(BaseAgent):
+    """
+    Planner agent for creating detailed execution plans.
+
+    This agent specializes in analyzing tasks and creating comprehensive,
+    step-by-step plans that break down complex work into manageable,
+    executable steps using Cage-native API endpoints.
+    """
+
+    # Plan directories already created in this process
+    _ensured_dirs: ClassVar[set[Path]] = set()
+
+    def _get_agent_type(self) -> AgentType:
+        """Return the agent type."""
+        return AgentType.PLANNER
+
+    def _get_tools(self) -> list:
+        """
+        Get the tools for the planner agent.
+
+        The planner agent doesn't use tools directly - it creates plans
+        that other agents will execute.
+
+        Returns:
+            Empty list (planner doesn't use tools)
+        """
+        return []
+
+    @classmethod
+    def create_default_config(cls) -> AgentConfig:
+        """
+        Create a default configuration for the planner agent.
+
+        Returns:
+            Default agent configuration
+        """
+        return AgentConfig(
+            role="Planner",
+            goal="Create detailed, actionable plans for task execution using Cage-native API endpoints",
+            backstory=_BACKSTORY,
             verbose=True,
             allow_delegation=False,
-            tools=[],
+            tools=(),
             metadata={
                 "specialization": "planning",
                 "output_format": "json",
-                "api_endpoints": [
-                    "POST /files/edit",
-                    "GET /files/sha",
-                    "GET /diff",
-                    "POST /git/revert",
-                    "POST /runner/exec",
-                    "POST /git/open_pr",
-                    "POST /tasks/update",
-                ],
+                "plan_cache_enabled": False,
+                "plan_template_threshold": 0.85,
+                "api_endpoints": list(_API_ENDPOINTS),
             },
         )
 
@@ -155,8 +569,8 @@ class PlannerAgent(BaseAgent):
         self,
         task_title: str,
         task_summary: str,
-        success_criteria: list[str],
-        acceptance_checks: list[str],
+        success_criteria: Sequence[str],
+        acceptance_checks: Sequence[str],
     ) -> str:
         """
         Create a task description for plan creation.
@@ -170,29 +584,57 @@ class PlannerAgent(BaseAgent):
         Returns:
             Task description for the planner
         """
-        return f"""Create a detailed execution plan for task: {task_title}
+        return (
+            f"{_PLAN_TASK_PREFIX}\n\n"
+            f"        Task: {task_title}\n"
+            f"        Task Summary: {task_summary}\n"
+            f"        Success Criteria: {'; '.join(success_criteria)}\n"
+            f"        Acceptance Checks: {'; '.join(acceptance_checks)}\n"
+            f'        Commit message format: "type: description (links: task {task_title})"'
+        )
 
-        Task Summary: {task_summary}
-        Success Criteria: {success_criteria}
-        Acceptance Checks: {acceptance_checks}
+    def _get_plan_cache(self) -> Optional[PlanCache]:
+        """
+        Get the plan cache for this agent's repository.
 
-        Create a Cage-native execution plan that uses only API endpoints:
-        - Use POST /files/edit for all file operations (INSERT, UPDATE, DELETE)
-        - Use GET /files/sha for content validation
-        - Use GET /diff for change validation
-        - Use POST /git/revert for rollback operations
-        - Use POST /runner/exec for optional execution checks
-        - Use POST /git/open_pr for pull request creation
-        - Use POST /tasks/update for task updates
+        Returns:
+            The plan cache, or None if caching is disabled or no repo is set
+        """
+        if not self.config.metadata.get("plan_cache_enabled") or not self.repo_path:
+            return None
 
-        Include:
-        1. Branch name following convention: chore/task-name-YYYY-MM-DD
-        2. Task-linked commit messages with format: "type: description (links: task {task_title})"
-        3. Validation steps for each operation
-        4. Rollback paths for failure scenarios
-        5. Idempotent operations that can be re-run safely
+        cache = getattr(self, "_plan_cache", None)
+        if cache is None:
+            db_path = Path(self.repo_path) / ".cage" / "plans" / "cache.db"
+            try:
+                cache = PlanCache(db_path, logger=self.logger)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning("Plan cache unavailable: %s", e)
+                return None
+            self._plan_cache = cache
+        return cache
+
+    def _run_plan_task(self, description: str) -> Any:
+        """Execute a single planning task with the CrewAI agent."""
+        from crewai import Task
+
+        test_task = Task(
+            description=description,
+            agent=self.crewai_agent,
+            expected_output="Test response from planner agent",
+        )
+        return test_task.execute_sync()
 
-        Output must be valid JSON following the Cage-native plan schema."""
+    @staticmethod
+    def _parse_plan(result: Any) -> tuple[Any, Optional[str]]:
+        """
+        Parse and validate LLM plan output.
+
+        Returns:
+            Tuple of (plan data, schema error). Output that is not valid JSON
+            is wrapped as ``{"raw_output": ...}`` with no schema error.
+        """
+        return parse_plan_output(result)
 
     def test_agent(
         self, test_input: str, task_id: Optional[str] = None
@@ -207,79 +649,122 @@ class PlannerAgent(BaseAgent):
         Returns:
             Dictionary containing test results
         """
-        import json
-        from datetime import datetime
-
         if not self._initialized:
             self.initialize()
 
-        self.logger.info(f"Testing planner agent with input: {test_input[:100]}...")
+        self.logger.info("Testing planner agent with input: %.100s...", test_input)
 
         try:
-            # Create a simple test task
-            from crewai import Task
-
             # Add task_id context to the test input if provided
             enhanced_input = test_input
             if task_id:
                 enhanced_input = f"{test_input}\n\nTask ID: {task_id}\nTask File Reference: .cage/tasks/{task_id}.json"
 
-            test_task = Task(
-                description=enhanced_input,
-                agent=self.crewai_agent,
-                expected_output="Test response from planner agent",
-            )
-
-            # Execute the task
-            result = test_task.execute_sync()
-
-            # Parse the JSON result
-            try:
-                plan_data = json.loads(str(result))
-            except json.JSONDecodeError:
-                # If not valid JSON, wrap it
-                plan_data = {"raw_output": str(result)}
+            # Reuse the cached plan for the same task. The task text (without
+            # the task ID) is the key so reruns still hit.
+            plan_cache = self._get_plan_cache()
+            embedding = None
+            cached = None
+            template = None
+            if plan_cache is not None:
+                cached = plan_cache.get(test_input)
+                if not cached:
+                    # A similar plan belongs to another task, so it is only a
+                    # template for the LLM to adapt
+                    embedding = plan_cache.embed(test_input)
+                    template = plan_cache.nearest(
+                        embedding,
+                        self.config.metadata.get("plan_template_threshold", 0.85),
+                    )
+
+            if cached:
+                result = cached
+                self.logger.info("planner: cache hit")
+            elif template:
+                template_json, similarity = template
+                self.logger.info("planner: template hit similarity=%.2f", similarity)
+                result = self._run_plan_task(
+                    f"{enhanced_input}\n\nAdapt the following plan template to "
+                    f"the new task:\n{template_json}"
+                )
+            else:
+                result = self._run_plan_task(enhanced_input)
+
+            # Parse the JSON result and check it against the plan schema
+            plan_data, schema_error = self._parse_plan(result)
+            if schema_error and not cached:
+                # One corrective retry is cheaper than replanning after a
+                # malformed plan fails downstream
+                self.logger.warning("Plan failed schema validation: %s", schema_error)
+                result = self._run_plan_task(
+                    f"{enhanced_input}\n\nYour previous plan did not match the "
+                    f"required plan schema: {schema_error}\n"
+                    "Return a corrected plan as a single JSON object."
+                )
+                plan_data, schema_error = self._parse_plan(result)
+
+            if schema_error:
+                self.logger.warning("Plan failed schema validation: %s", schema_error)
+            elif (
+                plan_cache is not None
+                and not cached
+                and "raw_output" not in plan_data
+            ):
+                plan_cache.put(test_input, embedding, json_codec.dumps(plan_data))
+
+            # Read the clock once so the filename and createdAt agree
+            now = datetime.now()
 
             # Add task reference if task_id provided
             if task_id and isinstance(plan_data, dict):
                 plan_data["taskFileReference"] = f".cage/tasks/{task_id}.json"
-                plan_data["createdAt"] = datetime.now().isoformat() + "Z"
+                plan_data["createdAt"] = now.isoformat() + "Z"
 
             # Save plan to file if we have a task_id
             if task_id and isinstance(plan_data, dict):
                 try:
-                    # Ensure .cage/plans directory exists
+                    # Ensure .cage/plans directory exists (once per process)
                     plans_dir = self.repo_path / ".cage" / "plans"
-                    plans_dir.mkdir(parents=True, exist_ok=True)
+                    if plans_dir not in self._ensured_dirs:
+                        plans_dir.mkdir(parents=True, exist_ok=True)
+                        self._ensured_dirs.add(plans_dir)
 
                     # Generate filename with timestamp
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                    timestamp = (
+                        f"{now.year:04d}{now.month:02d}{now.day:02d}-"
+                        f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+                    )
                     plan_filename = f"plan-{task_id}-{timestamp}.json"
                     plan_path = plans_dir / plan_filename
 
-                    # Save the plan to file
-                    with open(plan_path, "w") as f:
-                        json.dump(plan_data, f, indent=2)
+                    # Save the plan atomically so readers never see a partial file
+                    try:
+                        json_codec.write_json_atomic(plan_path, plan_data)
+                    except FileNotFoundError:
+                        # Removed since it was created, e.g. by cleaning the
+                        # repository
+                        plans_dir.mkdir(parents=True, exist_ok=True)
+                        json_codec.write_json_atomic(plan_path, plan_data)
 
-                    self.logger.info(f"Plan saved to {plan_path}")
+                    self.logger.info("Plan saved to %s", plan_path)
 
                     # Add plan file reference to the response
                     plan_data["planFile"] = str(plan_path.relative_to(self.repo_path))
 
                 except Exception as e:
-                    self.logger.error(f"Failed to save plan to file: {e}")
+                    self.logger.error("Failed to save plan to file: %s", e)
 
             return {
                 "success": True,
                 "agent_type": self.agent_type.value,
                 "role": self.config.role,
                 "input": test_input,
-                "output": json.dumps(plan_data, indent=2),
+                "output": json_codec.dumps(plan_data, indent=True),
                 "error": None,
             }
 
         except Exception as e:
-            self.logger.error(f"Error testing planner agent: {e}")
+            self.logger.error("Error testing planner agent: %s", e)
             return {
                 "success": False,
                 "agent_type": self.agent_type.value,
@@ -289,6 +774,92 @@ class PlannerAgent(BaseAgent):
                 "error": str(e),
             }
 
+    async def execute_async(self, prompt: str) -> Any:
+        """
+        Execute a planning task without blocking the event loop.
+
+        Args:
+            prompt: Task description for the planner
+
+        Returns:
+            Raw planner output
+        """
+        if not self._initialized:
+            self.initialize()
+        return await asyncio.to_thread(self._run_plan_task, prompt)
+
+    async def test_agent_batch(
+        self,
+        inputs: list[str],
+        task_ids: Optional[list[Optional[str]]] = None,
+        max_concurrency: int = 16,
+    ) -> list[dict[str, Any]]:
+        """
+        Run several planning requests concurrently.
+
+        Each request goes through ``test_agent`` (cache lookup, validation and
+        plan saving) on a worker thread, so LLM round-trips overlap instead of
+        running back to back. CrewAI agents are not thread-safe, so every
+        worker uses its own planner; the plan cache is shared.
+
+        Args:
+            inputs: Inputs to plan for
+            task_ids: Optional task IDs, one per input
+            max_concurrency: Maximum number of in-flight planning requests
+
+        Returns:
+            Test result dictionaries in the same order as ``inputs``
+        """
+        if task_ids is None:
+            task_ids = [None] * len(inputs)
+        if len(task_ids) != len(inputs):
+            raise ValueError("task_ids must have the same length as inputs")
+
+        # Build the plan cache before fanning out, so workers share one
+        plan_cache = self._get_plan_cache()
+
+        workers: asyncio.Queue[PlannerAgent] = asyncio.Queue()
+        for _ in range(min(max_concurrency, len(inputs))):
+            worker = type(self)(
+                self.config, logger=self.logger, repo_path=self.repo_path
+            )
+            if plan_cache is not None:
+                worker._plan_cache = plan_cache
+            workers.put_nowait(worker)
+
+        async def run_one(test_input: str, task_id: Optional[str]) -> dict[str, Any]:
+            # Workers build their CrewAI agent on first use, off the loop
+            worker = await workers.get()
+            try:
+                return await asyncio.to_thread(worker.test_agent, test_input, task_id)
+            finally:
+                workers.put_nowait(worker)
+
+        return await asyncio.gather(
+            *(
+                run_one(text, task_id)
+                for text, task_id in zip(inputs, task_ids, strict=True)
+            )
+        )
+
+
+@cache
+def get_planner_config() -> AgentConfig:
+    """
+    Get the default planner configuration, building it on first use.
+
+    Returns:
+        Shared default planner configuration
+    """
+    return PlannerAgent.create_default_config()
+
+
+# Agents exported by this module, for AgentRegistry.load_agents_from_module
+__agents__ = [(PlannerAgent, get_planner_config)]
+
 
-# Default configuration instance
-planner_config = PlannerAgent.create_default_config()
+def __getattr__(name: str) -> Any:
+    """Provide ``planner_config`` lazily for existing importers (PEP 562)."""
+    if name == "planner_config":
+        return get_planner_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
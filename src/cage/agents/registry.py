@@ -6,6 +6,9 @@ enabling dynamic crew construction and agent management.
 """
 
 import logging
+import os
+from collections import defaultdict
+from types import ModuleType
 from typing import Any, Optional
 
 from .base import AgentConfig, AgentType, BaseAgent
@@ -19,6 +22,17 @@ class AgentRegistry:
     different types of agents in the system.
     """
 
+    __slots__ = (
+        "logger",
+        "_agents",
+        "_agent_configs",
+        "_agent_instances",
+        "_agent_types",
+        "_by_type",
+        "_info_cache",
+        "_module_cache",
+    )
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize the agent registry.
@@ -30,6 +44,12 @@ class AgentRegistry:
         self._agents: dict[str, type[BaseAgent]] = {}
         self._agent_configs: dict[str, AgentConfig] = {}
         self._agent_instances: dict[str, BaseAgent] = {}
+        self._agent_types: dict[str, AgentType] = {}
+        # Reverse index of agent names per type; dict keys act as an
+        # insertion-ordered set so results follow registration order
+        self._by_type: defaultdict[AgentType, dict[str, None]] = defaultdict(dict)
+        self._info_cache: dict[str, dict[str, Any]] = {}
+        self._module_cache: dict[str, tuple[float, ModuleType]] = {}
 
         self.logger.info("Agent registry initialized")
 
@@ -53,17 +73,36 @@ class AgentRegistry:
         agent_name = name or config.role.lower().replace(" ", "_")
 
         if agent_name in self._agents:
-            self.logger.warning(f"Agent '{agent_name}' already registered, overwriting")
+            self.logger.warning(
+                "Agent '%s' already registered, overwriting", agent_name
+            )
 
         self._agents[agent_name] = agent_class
         self._agent_configs[agent_name] = config
+        self._info_cache.pop(agent_name, None)
+
+        # Resolve the agent type once so lookups never construct agents
+        self._forget_agent_type(agent_name)
+        try:
+            temp_instance = agent_class(config, logger=self.logger)
+            agent_type = temp_instance._get_agent_type()
+            self._agent_types[agent_name] = agent_type
+            self._by_type[agent_type][agent_name] = None
+        except Exception as e:
+            self.logger.warning("Error checking agent type for '%s': %s", agent_name, e)
 
         self.logger.info(
-            f"Registered agent '{agent_name}' of type {agent_class.__name__}"
+            "Registered agent '%s' of type %s", agent_name, agent_class.__name__
         )
 
         return agent_name
 
+    def _forget_agent_type(self, name: str) -> None:
+        """Remove an agent from the type cache and reverse index."""
+        agent_type = self._agent_types.pop(name, None)
+        if agent_type is not None:
+            self._by_type[agent_type].pop(name, None)
+
     def get_agent_class(self, name: str) -> Optional[type[BaseAgent]]:
         """
         Get an agent class by name.
@@ -103,7 +142,7 @@ class AgentRegistry:
         config = self.get_agent_config(name)
 
         if not agent_class or not config:
-            self.logger.error(f"Agent '{name}' not found in registry")
+            self.logger.error("Agent '%s' not found in registry", name)
             return None
 
         try:
@@ -113,11 +152,11 @@ class AgentRegistry:
             # Cache the instance
             self._agent_instances[name] = agent_instance
 
-            self.logger.info(f"Created agent instance '{name}'")
+            self.logger.info("Created agent instance '%s'", name)
             return agent_instance
 
         except Exception as e:
-            self.logger.error(f"Error creating agent '{name}': {e}")
+            self.logger.error("Error creating agent '%s': %s", name, e)
             return None
 
     def get_agent_instance(self, name: str) -> Optional[BaseAgent]:
@@ -151,20 +190,7 @@ class AgentRegistry:
         Returns:
             List of agent names of the specified type
         """
-        matching_agents = []
-
-        for name, agent_class in self._agents.items():
-            # Create a temporary instance to check the type
-            config = self._agent_configs.get(name)
-            if config:
-                try:
-                    temp_instance = agent_class(config, logger=self.logger)
-                    if temp_instance._get_agent_type() == agent_type:
-                        matching_agents.append(name)
-                except Exception as e:
-                    self.logger.warning(f"Error checking agent type for '{name}': {e}")
-
-        return matching_agents
+        return list(self._by_type.get(agent_type, ()))
 
     def get_agent_info(self, name: str) -> Optional[dict[str, Any]]:
         """
@@ -176,24 +202,31 @@ class AgentRegistry:
         Returns:
             Dictionary containing agent information or None if not found
         """
+        info = self._info_cache.get(name)
+        if info is not None:
+            # Copy, so callers cannot alter the cached entry
+            return dict(info)
+
         agent_class = self.get_agent_class(name)
         config = self.get_agent_config(name)
 
         if not agent_class or not config:
             return None
 
-        return {
+        agent_type = self._agent_types.get(name)
+
+        info = {
             "name": name,
             "class": agent_class.__name__,
             "role": config.role,
             "goal": config.goal,
-            "agent_type": agent_class(config, logger=self.logger)
-            ._get_agent_type()
-            .value,
+            "agent_type": agent_type.value if agent_type else None,
             "tools_count": len(config.tools),
             "verbose": config.verbose,
             "allow_delegation": config.allow_delegation,
         }
+        self._info_cache[name] = info
+        return dict(info)
 
     def list_all_agent_info(self) -> list[dict[str, Any]]:
         """
@@ -202,7 +235,7 @@ class AgentRegistry:
         Returns:
             List of dictionaries containing agent information
         """
-        return [self.get_agent_info(name) for name in self.list_agents()]
+        return [self.get_agent_info(name) for name in self._agents]
 
     def unregister_agent(self, name: str) -> bool:
         """
@@ -215,18 +248,20 @@ class AgentRegistry:
             True if successfully unregistered, False otherwise
         """
         if name not in self._agents:
-            self.logger.warning(f"Agent '{name}' not found in registry")
+            self.logger.warning("Agent '%s' not found in registry", name)
             return False
 
         # Remove from all dictionaries
         del self._agents[name]
         del self._agent_configs[name]
+        self._forget_agent_type(name)
+        self._info_cache.pop(name, None)
 
         # Remove instance if it exists
         if name in self._agent_instances:
             del self._agent_instances[name]
 
-        self.logger.info(f"Unregistered agent '{name}'")
+        self.logger.info("Unregistered agent '%s'", name)
         return True
 
     def clear_registry(self) -> None:
@@ -234,6 +269,10 @@ class AgentRegistry:
         self._agents.clear()
         self._agent_configs.clear()
         self._agent_instances.clear()
+        self._agent_types.clear()
+        self._by_type.clear()
+        self._info_cache.clear()
+        self._module_cache.clear()
         self.logger.info("Cleared agent registry")
 
     def load_agents_from_module(self, module_path: str) -> list[str]:
@@ -249,14 +288,35 @@ class AgentRegistry:
         loaded_agents = []
 
         try:
-            # Import the module
-            import importlib.util
-
-            spec = importlib.util.spec_from_file_location("agent_module", module_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Look for agent classes and configurations
+            # Reuse the already-executed module unless the file has changed
+            mtime = os.stat(module_path).st_mtime
+            cached = self._module_cache.get(module_path)
+            if cached and cached[0] == mtime:
+                module = cached[1]
+            else:
+                # Import the module
+                import importlib.util
+
+                spec = importlib.util.spec_from_file_location(
+                    "agent_module", module_path
+                )
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._module_cache[module_path] = (mtime, module)
+
+            # Prefer an explicit manifest of (agent class, config) pairs; the
+            # config may be a zero-argument factory so it is built lazily
+            manifest = getattr(module, "__agents__", None)
+            if manifest is not None:
+                for agent_class, config in manifest:
+                    if callable(config):
+                        config = config()
+                    name = self.register_agent(agent_class, config)
+                    loaded_agents.append(name)
+                    self.logger.info("Loaded agent '%s' from module", name)
+                return loaded_agents
+
+            # Fall back to looking for agent classes and configurations
             for attr_name in dir(module):
                 attr = getattr(module, attr_name)
 
@@ -272,10 +332,12 @@ class AgentRegistry:
                         if isinstance(config, AgentConfig):
                             name = self.register_agent(attr, config)
                             loaded_agents.append(name)
-                            self.logger.info(f"Loaded agent '{name}' from module")
+                            self.logger.info("Loaded agent '%s' from module", name)
 
         except Exception as e:
-            self.logger.error(f"Error loading agents from module '{module_path}': {e}")
+            self.logger.error(
+                "Error loading agents from module '%s': %s", module_path, e
+            )
 
         return loaded_agents
 
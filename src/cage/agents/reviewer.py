@@ -5,9 +5,77 @@ This module defines the Reviewer agent for reviewing changes and enforcing
 quality standards and policy compliance.
 """
 
+import sys
+from collections.abc import Sequence
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Any
 
 from .base import AgentConfig, AgentType, BaseAgent
 
+# Built and interned once at import, shared by every default config
+_BACKSTORY = sys.intern(
+    """You are an expert code reviewer and quality assurance specialist.
+            You carefully review all changes for correctness, adherence to coding standards,
+            security best practices, and policy compliance. You also verify that the
+            Implementer used the EditorTool correctly for all file operations.
+
+            CRITICAL RULES:
+            1. Verify that EditorTool was used for all file operations
+            2. Check that no terminal commands were used inappropriately
+            3. Ensure file content is correct and complete
+            4. Validate that file paths and extensions are appropriate
+            5. Confirm that intent descriptions are meaningful
+            6. Verify that all changes follow coding standards
+            7. Check that task requirements are met
+
+            You ensure that all changes meet the required quality standards before they are committed."""
+)
+
+_REVIEW_TEMPLATE = sys.intern(
+    """Review the changes made for task: {task_title}
+
+        CRITICAL REVIEW CHECKLIST:
+        1. Verify that EditorTool was used for ALL file operations
+        2. Check that no terminal commands were used inappropriately
+        3. Ensure file content is correct and complete
+        4. Validate that file paths and extensions are appropriate
+        5. Confirm that intent descriptions are meaningful
+        6. Verify that all changes follow coding standards
+        7. Check that task requirements are met
+
+        Use the EditorTool to read and verify the created/modified files."""
+)
+
+_REVIEW_CRITERIA = (
+    "tool_usage_verification",
+    "code_quality",
+    "security_compliance",
+    "policy_adherence",
+    "requirement_fulfillment",
+)
+_VERIFICATION_METHODS = (
+    "file_content_check",
+    "tool_usage_audit",
+    "quality_assessment",
+)
+
+# Read-only so the one instance can be shared by every default config
+_DEFAULT_METADATA = MappingProxyType(
+    {
+        "specialization": "review",
+        "required_tools": ("EditorToolWrapper",),
+        "review_criteria": _REVIEW_CRITERIA,
+        "verification_methods": _VERIFICATION_METHODS,
+    }
+)
+
+
+@lru_cache(maxsize=512)
+def _build_review_task(task_title: str) -> str:
+    """Render the review task description for a task title."""
+    return _REVIEW_TEMPLATE.format(task_title=task_title)
+
 
 class ReviewerAgent(BaseAgent):
     """
@@ -17,11 +85,13 @@ class ReviewerAgent(BaseAgent):
     to coding standards, security best practices, and policy compliance.
     """
 
+    __slots__ = ()
+
     def _get_agent_type(self) -> AgentType:
         """Return the agent type."""
         return AgentType.REVIEWER
 
-    def _get_tools(self) -> list:
+    def _get_tools(self) -> Sequence:
         """
         Get the tools for the reviewer agent.
 
@@ -38,46 +108,28 @@ class ReviewerAgent(BaseAgent):
         """
         Create a default configuration for the reviewer agent.
 
+        The config is built once and shared; it is immutable, so callers
+        derive variations with ``dataclasses.replace``.
+
         Returns:
             Default agent configuration
         """
-        return AgentConfig(
-            role="Reviewer",
-            goal="Review changes for quality, compliance, and proper tool usage",
-            backstory="""You are an expert code reviewer and quality assurance specialist.
-            You carefully review all changes for correctness, adherence to coding standards,
-            security best practices, and policy compliance. You also verify that the
-            Implementer used the EditorTool correctly for all file operations.
-
-            CRITICAL RULES:
-            1. Verify that EditorTool was used for all file operations
-            2. Check that no terminal commands were used inappropriately
-            3. Ensure file content is correct and complete
-            4. Validate that file paths and extensions are appropriate
-            5. Confirm that intent descriptions are meaningful
-            6. Verify that all changes follow coding standards
-            7. Check that task requirements are met
+        return cls._build_default_config()
 
-            You ensure that all changes meet the required quality standards before they are committed.""",
+    @staticmethod
+    @cache
+    def _build_default_config() -> AgentConfig:
+        """Build the default reviewer configuration."""
+        return AgentConfig(
+            role=sys.intern("Reviewer"),
+            goal=sys.intern(
+                "Review changes for quality, compliance, and proper tool usage"
+            ),
+            backstory=_BACKSTORY,
             verbose=True,
             allow_delegation=False,
-            tools=[],  # Will be injected at runtime
-            metadata={
-                "specialization": "review",
-                "required_tools": ["EditorToolWrapper"],
-                "review_criteria": [
-                    "tool_usage_verification",
-                    "code_quality",
-                    "security_compliance",
-                    "policy_adherence",
-                    "requirement_fulfillment",
-                ],
-                "verification_methods": [
-                    "file_content_check",
-                    "tool_usage_audit",
-                    "quality_assessment",
-                ],
-            },
+            tools=(),  # Will be injected at runtime
+            metadata=_DEFAULT_METADATA,
         )
 
     def create_review_task(self, task_title: str) -> str:
@@ -90,18 +142,7 @@ class ReviewerAgent(BaseAgent):
         Returns:
             Task description for the reviewer
         """
-        return f"""Review the changes made for task: {task_title}
-
-        CRITICAL REVIEW CHECKLIST:
-        1. Verify that EditorTool was used for ALL file operations
-        2. Check that no terminal commands were used inappropriately
-        3. Ensure file content is correct and complete
-        4. Validate that file paths and extensions are appropriate
-        5. Confirm that intent descriptions are meaningful
-        6. Verify that all changes follow coding standards
-        7. Check that task requirements are met
-
-        Use the EditorTool to read and verify the created/modified files."""
+        return _build_review_task(task_title)
 
     def create_quality_checklist(self) -> list[str]:
         """
@@ -124,5 +165,8 @@ class ReviewerAgent(BaseAgent):
         ]
 
 
-# Default configuration instance
-reviewer_config = ReviewerAgent.create_default_config()
+def __getattr__(name: str) -> Any:
+    """Provide ``reviewer_config`` lazily for existing importers (PEP 562)."""
+    if name == "reviewer_config":
+        return ReviewerAgent.create_default_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
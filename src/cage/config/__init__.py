@@ -8,7 +8,17 @@ This module provides a centralized configuration system that:
 - Validates configuration values
 """
 
+from typing import Any
+
 from .config_manager import ConfigManager, get_config
-from .settings import Settings
 
 __all__ = ["ConfigManager", "get_config", "Settings"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import Settings (and with it pydantic) only when first accessed."""
+    if name == "Settings":
+        from .settings import Settings
+
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,27 +6,105 @@ environments and services.
 """
 
 import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from .settings import Settings
+if TYPE_CHECKING:
+    # Imported lazily at runtime: pulling in pydantic is only needed once
+    # settings are actually loaded
+    from .settings import Settings
+
+_CONFIG_DIR: Path = Path(__file__).resolve().parents[3] / "config"
+_CONFIG_FILES: dict[str, Path] = {
+    env: _CONFIG_DIR / f"{env}.env"
+    for env in ("development", "testing", "staging", "production")
+}
+
+# Settings built per environment, shared by all managers in the process.
+# Values are (settings, monotonic load time).
+_SETTINGS_BY_ENV: dict[str, tuple["Settings", float]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class FastSettings:
+    """
+    Unvalidated service URLs read straight from the environment.
+
+    Building this is much cheaper than validating the full ``Settings``
+    model, so the URL getters use it until ``Settings`` has been loaded.
+    A field is None when its variable is not set in ``os.environ``; the
+    getters then load ``Settings``, which also reads the ``.env`` file.
+    """
+
+    database_url: str | None
+    redis_url: str | None
+    api_base_url: str | None
+
+    @classmethod
+    def from_environ(cls) -> "FastSettings":
+        """Read the fields from os.environ in one pass.
+
+        Returns:
+            FastSettings populated from the environment
+        """
+        # Settings matches env var names case-insensitively
+        env = {key.lower(): value for key, value in os.environ.items()}
+        return cls(
+            database_url=env.get("db_url"),
+            redis_url=env.get("redis_url"),
+            api_base_url=env.get("api_base_url"),
+        )
 
 
 class ConfigManager:
     """Manages configuration loading and access."""
 
-    def __init__(self, environment: str | None = None):
+    __slots__ = (
+        "environment",
+        "settings_ttl",
+        "_settings",
+        "_loaded_at",
+        "_fast_settings",
+        "_mcp_dict",
+        "_logging_dict",
+        "_agent_dicts",
+        "_is_dev",
+        "_is_test",
+        "_is_prod",
+        "_config_dir",
+    )
+
+    def __init__(
+        self, environment: str | None = None, settings_ttl: float | None = None
+    ):
         """Initialize the configuration manager.
 
         Args:
             environment: Environment name (development, testing, production)
                         If None, will be determined from ENVIRONMENT env var
+            settings_ttl: Seconds after which loaded settings are rebuilt.
+                        If None, settings are kept until reload_config()
         """
         self.environment = environment or os.getenv("ENVIRONMENT", "development")
-        self._settings: Settings | None = None
-        self._config_dir = Path(__file__).parent.parent.parent.parent / "config"
-
-    def load_config(self) -> Settings:
+        self.settings_ttl = settings_ttl
+        self._settings: "Settings | None" = None
+        self._loaded_at = 0.0
+        self._fast_settings: FastSettings | None = None
+        # Read-only dict snapshots of settings sections, rebuilt on reload
+        self._mcp_dict: Mapping[str, Any] | None = None
+        self._logging_dict: Mapping[str, Any] | None = None
+        self._agent_dicts: dict[str, Mapping[str, Any]] = {}
+        # Environment predicates, resolved at load time
+        self._is_dev: bool | None = None
+        self._is_test: bool | None = None
+        self._is_prod = self.environment == "production"
+        self._config_dir = _CONFIG_DIR
+
+    def load_config(self) -> "Settings":
         """Load configuration for the current environment.
 
         Returns:
@@ -36,54 +114,99 @@ class ConfigManager:
             FileNotFoundError: If environment config file not found
             ValueError: If configuration validation fails
         """
-        if self._settings is not None:
+        if self._settings is not None and not self._is_stale(self._loaded_at):
             return self._settings
 
-        # Determine config file path
-        config_file = self._get_config_file_path()
-
-        # Load environment-specific config if it exists
-        if config_file.exists():
-            os.environ["ENV_FILE"] = str(config_file)
-
-        # Load settings
-        self._settings = Settings()
+        cached = _SETTINGS_BY_ENV.get(self.environment)
+        if cached is not None and not self._is_stale(cached[1]):
+            self._settings, self._loaded_at = cached
+        else:
+            # Determine config file path
+            config_file = self._get_config_file_path()
+
+            # Load environment-specific config if it exists
+            if config_file.exists():
+                os.environ["ENV_FILE"] = str(config_file)
+
+            # Load settings
+            from .settings import Settings
+
+            self._settings = Settings()
+            self._loaded_at = time.monotonic()
+            _SETTINGS_BY_ENV[self.environment] = (self._settings, self._loaded_at)
+
+        self._agent_dicts = {}
+        self._mcp_dict = MappingProxyType(self._settings.mcp.dict())
+        self._logging_dict = MappingProxyType(self._settings.logging.dict())
+        self._is_dev = bool(
+            self._settings.dev_mode or self.environment == "development"
+        )
+        self._is_test = bool(self._settings.test_mode or self.environment == "testing")
+        self._is_prod = self.environment == "production"
 
         return self._settings
 
-    def get_config(self) -> Settings:
+    def get_config(self) -> "Settings":
         """Get the current configuration.
 
         Returns:
             Settings object with current configuration
         """
-        if self._settings is None:
+        if self._settings is None or self._is_stale(self._loaded_at):
             return self.load_config()
         return self._settings
 
-    def reload_config(self) -> Settings:
+    def _is_stale(self, loaded_at: float) -> bool:
+        """Check whether settings loaded at the given time have expired.
+
+        Args:
+            loaded_at: Monotonic time the settings were loaded
+
+        Returns:
+            True if a TTL is set and has elapsed
+        """
+        return (
+            self.settings_ttl is not None
+            and time.monotonic() - loaded_at >= self.settings_ttl
+        )
+
+    def reload_config(self) -> "Settings":
         """Reload configuration from files.
 
         Returns:
             Settings object with reloaded configuration
         """
+        _SETTINGS_BY_ENV.pop(self.environment, None)
+        from .settings import _path_exists
+
+        _path_exists.cache_clear()
         self._settings = None
+        self._fast_settings = None
+        self._mcp_dict = None
+        self._logging_dict = None
+        self._agent_dicts = {}
+        self._is_dev = None
+        self._is_test = None
         return self.load_config()
 
-    def get_agent_config(self, agent_name: str) -> dict[str, Any]:
+    def get_agent_config(self, agent_name: str) -> Mapping[str, Any]:
         """Get configuration for a specific agent.
 
         Args:
             agent_name: Name of the agent (e.g., 'planner', 'implementer')
 
         Returns:
-            Dictionary with agent configuration
+            Read-only mapping with agent configuration
         """
-        settings = self.get_config()
-        agent_settings = settings.get_agent_config(agent_name)
+        agent_dict = self._agent_dicts.get(agent_name)
+        if agent_dict is None:
+            settings = self.get_config()
+            agent_settings = settings.get_agent_config(agent_name)
 
-        # Convert to dictionary for easier access
-        return agent_settings.dict()  # type: ignore[no-any-return]
+            # Convert to dictionary once for easier access
+            agent_dict = MappingProxyType(agent_settings.dict())
+            self._agent_dicts[agent_name] = agent_dict
+        return agent_dict
 
     def get_database_url(self) -> str:
         """Get the database URL.
@@ -91,6 +214,10 @@ class ConfigManager:
         Returns:
             Database connection URL
         """
+        if self._settings is None:
+            database_url = self._get_fast_settings().database_url
+            if database_url:
+                return database_url
         settings = self.get_config()
         return settings.database.url
 
@@ -100,6 +227,10 @@ class ConfigManager:
         Returns:
             Redis connection URL
         """
+        if self._settings is None:
+            redis_url = self._get_fast_settings().redis_url
+            if redis_url:
+                return redis_url
         settings = self.get_config()
         return settings.redis.url
 
@@ -109,26 +240,42 @@ class ConfigManager:
         Returns:
             API base URL
         """
+        if self._settings is None:
+            api_base_url = self._get_fast_settings().api_base_url
+            if api_base_url:
+                return api_base_url
         settings = self.get_config()
         return settings.api.base_url
 
-    def get_mcp_config(self) -> dict[str, Any]:
+    def _get_fast_settings(self) -> FastSettings:
+        """Get the environment fast-path settings, reading them on first use.
+
+        Returns:
+            FastSettings for this manager
+        """
+        if self._fast_settings is None:
+            self._fast_settings = FastSettings.from_environ()
+        return self._fast_settings
+
+    def get_mcp_config(self) -> Mapping[str, Any]:
         """Get MCP server configuration.
 
         Returns:
-            Dictionary with MCP configuration
+            Read-only mapping with MCP configuration
         """
-        settings = self.get_config()
-        return settings.mcp.dict()  # type: ignore[no-any-return]
+        if self._mcp_dict is None:
+            self.load_config()
+        return self._mcp_dict  # type: ignore[return-value]
 
-    def get_logging_config(self) -> dict[str, Any]:
+    def get_logging_config(self) -> Mapping[str, Any]:
         """Get logging configuration.
 
         Returns:
-            Dictionary with logging configuration
+            Read-only mapping with logging configuration
         """
-        settings = self.get_config()
-        return settings.logging.dict()  # type: ignore[no-any-return]
+        if self._logging_dict is None:
+            self.load_config()
+        return self._logging_dict  # type: ignore[return-value]
 
     def is_development(self) -> bool:
         """Check if running in development mode.
@@ -136,8 +283,9 @@ class ConfigManager:
         Returns:
             True if in development mode
         """
-        settings = self.get_config()
-        return settings.dev_mode or self.environment == "development"
+        if self._is_dev is None:
+            self.load_config()
+        return self._is_dev  # type: ignore[return-value]
 
     def is_testing(self) -> bool:
         """Check if running in testing mode.
@@ -145,8 +293,9 @@ class ConfigManager:
         Returns:
             True if in testing mode
         """
-        settings = self.get_config()
-        return settings.test_mode or self.environment == "testing"
+        if self._is_test is None:
+            self.load_config()
+        return self._is_test  # type: ignore[return-value]
 
     def is_production(self) -> bool:
         """Check if running in production mode.
@@ -154,7 +303,7 @@ class ConfigManager:
         Returns:
             True if in production mode
         """
-        return self.environment == "production"
+        return self._is_prod
 
     def _get_config_file_path(self) -> Path:
         """Get the path to the environment-specific config file.
@@ -162,8 +311,9 @@ class ConfigManager:
         Returns:
             Path to the config file
         """
-        config_file_name = f"{self.environment}.env"
-        return self._config_dir / config_file_name
+        return _CONFIG_FILES.get(self.environment) or (
+            self._config_dir / f"{self.environment}.env"
+        )
 
     def validate_config(self) -> bool:
         """Validate the current configuration.
@@ -181,28 +331,35 @@ class ConfigManager:
             raise ValueError(f"Configuration validation failed: {e}") from e
 
 
-# Global configuration manager instance
-_config_manager: ConfigManager | None = None
+# Configuration manager instances, one per environment
+_config_managers: dict[str, ConfigManager] = {}
 
 
 def get_config_manager(environment: str | None = None) -> ConfigManager:
     """Get the global configuration manager instance.
 
+    Each environment keeps its own manager, so alternating between
+    environments reuses already-loaded settings.
+
     Args:
         environment: Environment name (optional)
 
     Returns:
         ConfigManager instance
     """
-    global _config_manager
-    if _config_manager is None or (
-        environment and _config_manager.environment != environment
-    ):
-        _config_manager = ConfigManager(environment)
-    return _config_manager
+    environment = environment or os.getenv("ENVIRONMENT", "development")
+    manager = _config_managers.get(environment)
+    if manager is None:
+        manager = _config_managers[environment] = ConfigManager(environment)
+    return manager
+
+
+def clear_config_managers() -> None:
+    """Drop all cached configuration manager instances."""
+    _config_managers.clear()
 
 
-def get_config(environment: str | None = None) -> Settings:
+def get_config(environment: str | None = None) -> "Settings":
     """Get configuration for the specified environment.
 
     Args:
@@ -215,7 +372,7 @@ def get_config(environment: str | None = None) -> Settings:
     return manager.get_config()
 
 
-def reload_config(environment: str | None = None) -> Settings:
+def reload_config(environment: str | None = None) -> "Settings":
     """Reload configuration for the specified environment.
 
     Args:
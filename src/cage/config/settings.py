@@ -5,11 +5,28 @@ This module defines the configuration schema using Pydantic for validation
 and type safety.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseSettings, Field, validator
 
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_LOG_FORMATS = frozenset({"text", "json"})
+_VALID_ENVIRONMENTS = frozenset({"development", "testing", "staging", "production"})
+
+
+@lru_cache(maxsize=32)
+def _path_exists(path: str) -> bool:
+    """
+    Check whether a path exists, caching the result per path string.
+
+    Results are kept until ``_path_exists.cache_clear()`` is called (done by
+    ``ConfigManager.reload_config``), so a repository created after the first
+    check is only seen after a reload.
+    """
+    return Path(path).exists()
+
 
 class DatabaseSettings(BaseSettings):
     """Database configuration settings."""
@@ -83,17 +100,22 @@ class LoggingSettings(BaseSettings):
 
     @validator("level")  # type: ignore[misc]
     def validate_log_level(cls, v: str) -> str:
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of {valid_levels}")
-        return v.upper()
+        # Already-canonical values need no case conversion
+        if v in _VALID_LOG_LEVELS:
+            return v
+        upper = v.upper()
+        if upper not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of {sorted(_VALID_LOG_LEVELS)}")
+        return upper
 
     @validator("format")  # type: ignore[misc]
     def validate_log_format(cls, v: str) -> str:
-        valid_formats = ["text", "json"]
-        if v.lower() not in valid_formats:
-            raise ValueError(f"Log format must be one of {valid_formats}")
-        return v.lower()
+        if v in _VALID_LOG_FORMATS:
+            return v
+        lower = v.lower()
+        if lower not in _VALID_LOG_FORMATS:
+            raise ValueError(f"Log format must be one of {sorted(_VALID_LOG_FORMATS)}")
+        return lower
 
 
 class AgentSettings(BaseSettings):
@@ -164,17 +186,26 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
+        # Settings are shared process-wide once loaded; keep them immutable
+        # and skip pydantic's defensive copies of nested models
+        allow_mutation = False
+        copy_on_model_validation = "none"
+        validate_assignment = False
 
     @validator("environment")  # type: ignore[misc]
     def validate_environment(cls, v: str) -> str:
-        valid_environments = ["development", "testing", "staging", "production"]
-        if v.lower() not in valid_environments:
-            raise ValueError(f"Environment must be one of {valid_environments}")
-        return v.lower()
+        if v in _VALID_ENVIRONMENTS:
+            return v
+        lower = v.lower()
+        if lower not in _VALID_ENVIRONMENTS:
+            raise ValueError(
+                f"Environment must be one of {sorted(_VALID_ENVIRONMENTS)}"
+            )
+        return lower
 
     @validator("repo_path")  # type: ignore[misc]
     def validate_repo_path(cls, v: str | Path) -> str | Path:
-        if not Path(v).exists():
+        if not _path_exists(str(v)):
             raise ValueError(f"Repository path does not exist: {v}")
         return v
 
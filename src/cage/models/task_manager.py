@@ -5,12 +5,16 @@ This module provides the TaskManager class for task file management operations.
 """
 
 import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Union
 
 import jsonschema
 
+from .task_changelog_entry import TaskChangelogEntry
 from .task_commit import TaskCommit
 from .task_file import TaskFile
 from .task_provenance import TaskProvenance
@@ -27,6 +31,12 @@ class TaskManager:
         self.schema_path = self.tasks_dir / "_schema.json"
         self.status_path = self.tasks_dir / "_status.json"
 
+        # Changelog entries held back by batch_updates, and the nesting depth
+        # of open batches, per task
+        self._pending_changelog: dict[str, list[TaskChangelogEntry]] = {}
+        self._batch_depth: dict[str, int] = {}
+        self._batch_lock = threading.Lock()
+
         # Copy schema file from main cage repository if it doesn't exist
         self._ensure_schema_file()
 
@@ -100,9 +110,9 @@ class TaskManager:
         """Save a task file."""
         task_path = self.tasks_dir / f"{task.id}.json"
         try:
-            task_dict = task.model_dump()
-            with open(task_path, "w") as f:
-                json.dump(task_dict, f, indent=2)
+            # Serialized by pydantic-core directly, without an intermediate dict
+            with open(task_path, "w", encoding="utf-8") as f:
+                f.write(task.model_dump_json(indent=2))
             print(f"Successfully saved task {task.id} to {task_path}")
             return True
         except Exception as e:
@@ -140,6 +150,15 @@ class TaskManager:
         task_data = task.model_dump()
         task_data.update(updates)
 
+        # Write changelog entries held back by an open batch along with this
+        # update, after any changelog in the updates
+        pending = self._take_pending_changelog(task_id)
+        if pending:
+            task_data["changelog"] = [
+                *task_data.get("changelog", []),
+                *(entry.model_dump() for entry in pending),
+            ]
+
         # Update timestamp
         task_data["updated_at"] = datetime.now().isoformat()
 
@@ -148,10 +167,97 @@ class TaskManager:
             updated_task = TaskFile(**task_data)
             if self.save_task(updated_task):
                 return updated_task
-            return None
         except ValueError as e:
             print(f"Error updating task {task_id}: {e}")
-            return None
+
+        # Not written; keep the held-back entries for a later write
+        self._requeue_pending_changelog(task_id, pending)
+        return None
+
+    def append_changelog(self, task_id: str, entry: dict[str, Any]) -> bool:
+        """
+        Append a changelog entry to a task.
+
+        Inside batch_updates for the task the entry is only queued, and is
+        written with the next update_task or when the batch ends.
+
+        Returns:
+            True if the entry was written or queued
+        """
+        try:
+            changelog_entry = TaskChangelogEntry(**entry)
+        except ValueError as e:
+            print(f"Error updating task {task_id}: {e}")
+            return False
+
+        with self._batch_lock:
+            pending = self._pending_changelog.get(task_id)
+            if pending is not None:
+                pending.append(changelog_entry)
+                return True
+
+        return self._save_changelog(task_id, [changelog_entry])
+
+    @contextmanager
+    def batch_updates(self, task_id: str) -> Iterator[None]:
+        """
+        Coalesce changelog writes of a task within a block.
+
+        Changelog entries appended inside the block are held in memory and
+        written by the next update_task for the task, so a run that logs
+        many operations and then updates the task writes the file once.
+        Entries still pending when the outermost block exits are written
+        then. Blocks for the same task may nest.
+        """
+        with self._batch_lock:
+            self._batch_depth[task_id] = self._batch_depth.get(task_id, 0) + 1
+            self._pending_changelog.setdefault(task_id, [])
+        try:
+            yield
+        finally:
+            with self._batch_lock:
+                depth = self._batch_depth[task_id] - 1
+                if depth:
+                    self._batch_depth[task_id] = depth
+                    pending = []
+                else:
+                    del self._batch_depth[task_id]
+                    pending = self._pending_changelog.pop(task_id)
+            if pending:
+                self._save_changelog(task_id, pending)
+
+    def _take_pending_changelog(self, task_id: str) -> list[TaskChangelogEntry]:
+        """Remove and return the changelog entries queued for a task."""
+        with self._batch_lock:
+            pending = self._pending_changelog.get(task_id)
+            if not pending:
+                return []
+            self._pending_changelog[task_id] = []
+            return pending
+
+    def _requeue_pending_changelog(
+        self, task_id: str, entries: list[TaskChangelogEntry]
+    ) -> None:
+        """Put changelog entries that could not be written back in the queue."""
+        if not entries:
+            return
+        with self._batch_lock:
+            pending = self._pending_changelog.get(task_id)
+            if pending is not None:
+                pending[:0] = entries
+                return
+        # The batch has ended in the meantime; write the entries directly
+        self._save_changelog(task_id, entries)
+
+    def _save_changelog(self, task_id: str, entries: list[TaskChangelogEntry]) -> bool:
+        """Append changelog entries to a stored task without re-validating it."""
+        task = self.load_task(task_id)
+        if not task:
+            return False
+
+        task.changelog.extend(entries)
+        task.updated_at = datetime.now().isoformat()
+        return self.save_task(task)
 
     def list_tasks(self) -> list[dict[str, Any]]:
         """List all task files."""
@@ -4,7 +4,7 @@ Task plan model for Cage.
 This module provides the TaskPlan model for task execution plans.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import BaseModel
 
@@ -16,3 +16,8 @@ class TaskPlan(BaseModel):
     assumptions: list[str] = []
     steps: list[dict[str, Any]] = []
     commit_message: str = ""
+    # Pointer to the crew run that produced the plan; the plan content lives
+    # in the run's plan.json rather than in the task file
+    run_id: Optional[str] = None
+    created_at: Optional[str] = None
+    plan_path: Optional[str] = None
@@ -5,43 +5,166 @@ This module implements the CrewAI integration using the new modular agent system
 providing dynamic crew construction and individual agent testing capabilities.
 """
 
-import json
+import asyncio
+import contextvars
 import logging
+import os
 import re
+import threading
+import time
 import uuid
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
-from crewai import Crew, Process, Task
 from crewai.tools import BaseTool
 from pydantic import BaseModel
 
-from ..agents import AgentFactory, AgentRegistry, CrewBuilder
-from ..agents.committer import CommitterAgent, committer_config
-from ..agents.config import AgentConfigManager
-from ..agents.implementer import ImplementerAgent, implementer_config
-from ..agents.planner import PlannerAgent, planner_config
-from ..agents.reviewer import ReviewerAgent, reviewer_config
-from ..agents.verifier import VerifierAgent, verifier_config
 from ..models import TaskFile, TaskManager
+from ..utils import json_codec
 from .editor_tool import EditorTool, FileOperation, OperationType
-from .git_tool import GitTool
+from .git_tool import GitTool, make_git_tool
 
+# The crew runtime and the agent modules are imported where they are used, so
+# callers that only need the tool wrappers do not load them
+if TYPE_CHECKING:
+    from crewai import Crew, Process, Task
 
-@dataclass
+    from ..agents import AgentFactory, AgentRegistry, CrewBuilder
+    from ..agents.config import AgentConfigManager
+
+_T = TypeVar("_T")
+
+# Detailed logger for tool calls made by agents, shared by the tool wrappers
+_CREW_LOGGER = logging.getLogger(f"{__name__}.crewai")
+
+# Task whose plan is running in the current context; the editor wrapper puts
+# it in correlation IDs so EditorTool logs operations to that task's changelog
+_RUN_TASK_ID: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "cage_run_task_id", default=None
+)
+
+# Operation names agents use for EditorTool operations, keyed by the
+# upper-cased name and resolved straight to the enum member
+_OP_CANON = MappingProxyType(
+    {
+        **{op.value: op for op in OperationType},
+        "CREATE": OperationType.INSERT,
+        "WRITE": OperationType.INSERT,
+        "MAKE": OperationType.INSERT,
+        "NEW": OperationType.INSERT,
+        "READ": OperationType.GET,
+        "VIEW": OperationType.GET,
+        "MODIFY": OperationType.UPDATE,
+        "EDIT": OperationType.UPDATE,
+        "CHANGE": OperationType.UPDATE,
+        "REMOVE": OperationType.DELETE,
+    }
+)
+
+# Shared pool for artefact writes; bounded to avoid exhausting file
+# descriptors on large uploads
+_FILE_WRITE_WORKERS = 8
+_FILE_WRITE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_FILE_WRITE_WORKERS, thread_name_prefix="crew-artefact-write"
+)
+
+
+# Remediation task descriptions, formatted in
+# _create_remediation_task_description
+_REEVALUATE_TEMPLATE = """Re-evaluate the implementation for task: {task_title}
+
+Iteration {iteration}: Verification did not succeed, but no individual failures were captured.
+Re-read all related files using the EditorTool and ensure every acceptance criterion is fully satisfied.
+Avoid placeholders and confirm all endpoints and front-end flows are complete."""
+
+_REMEDIATION_TEMPLATE = """Address outstanding acceptance criteria for task: {task_title}
+
+Iteration {iteration} outstanding items:
+{outstanding}
+
+Implementation Instructions:
+1. Use the EditorTool to UPDATE existing files—do not leave placeholders or TODO comments.
+2. Deliver complete, working functionality that satisfies each listed criterion.
+3. Validate your changes via GET operations before concluding the update.
+4. Provide intent descriptions referencing the criterion you are fixing."""
+
+
+# Stands in for the plan in the implementer's task description when the plan
+# is created in the same crew (see create_and_apply)
+_FUSED_PLAN_REFERENCE = (
+    "the plan produced by the Planner in the preceding task (provided as context)"
+)
+
+
+# Task fields rewritten with the verification outcome of a plan execution
+_VERIFICATION_FIELDS = frozenset(
+    {
+        "success_criteria",
+        "acceptance_checks",
+        "issues_risks",
+        "metadata",
+    }
+)
+
+
+def _ns_isoformat(ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() timestamp as a local ISO timestamp."""
+    if ns is None:
+        return None
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return (
+        datetime.fromtimestamp(seconds)
+        .replace(microsecond=remainder // 1000)
+        .isoformat()
+    )
+
+
+def _criteria_texts(task: TaskFile) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Extract the success criteria and acceptance check texts of a task."""
+    return (
+        tuple(c.text for c in task.success_criteria),
+        tuple(c.text for c in task.acceptance_checks),
+    )
+
+
+@dataclass(slots=True)
 class RunStatus:
     """Status of a crew run."""
 
     run_id: str
     task_id: str
     status: str  # pending, running, completed, failed
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # time.time_ns() timestamps, formatted only when the status is written
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
     error: Optional[str] = None
-    logs: list[str] = None
-    artefacts: list[str] = None
+
+    # Logs and artefacts grow over a run, so they are appended to the
+    # logs.jsonl and artefacts.jsonl sidecars instead (see _append_jsonl)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the status as it is stored in status.json.
+
+        Returns:
+            Indented UTF-8 encoded JSON
+        """
+        return json_codec.dumps_bytes(
+            {
+                "run_id": self.run_id,
+                "task_id": self.task_id,
+                "status": self.status,
+                "started_at": _ns_isoformat(self.started_at_ns),
+                "completed_at": _ns_isoformat(self.completed_at_ns),
+                "error": self.error,
+            },
+            indent=True,
+        )
 
 
 class ModularCrewTool:
@@ -52,65 +175,163 @@ class ModularCrewTool:
     for dynamic crew construction and individual agent testing.
     """
 
-    def __init__(self, repo_path: Path, task_manager: TaskManager):
+    def __init__(
+        self, repo_path: Path, task_manager: TaskManager, max_concurrency: int = 8
+    ):
         self.repo_path = repo_path
         self.task_manager = task_manager
         self.editor_tool = EditorTool(repo_path, task_manager=task_manager)
-        self.git_tool = GitTool(repo_path)
+        self.git_tool = make_git_tool(repo_path)
         self.runs_dir = repo_path / ".cage" / "runs"
-        self.runs_dir.mkdir(parents=True, exist_ok=True)
+
+        # Directories known to exist, so repeated writes skip the mkdir call
+        self._dirs_created: set[Path] = set()
+        self._ensure_dir(self.runs_dir)
+
+        # Bounds concurrent crew kickoffs across plans to respect provider
+        # rate limits
+        self.max_concurrency = max_concurrency
+        self._crew_semaphore = asyncio.Semaphore(max_concurrency)
+
+        # (monotonic time, ISO timestamp) shared by records logged within the
+        # same millisecond; see _cached_now
+        self._ts_cache: tuple[float, str] = (float("-inf"), "")
+
+        # Parsed task and plan files keyed by ID/path, with the file mtime
+        # they were parsed at; see _load_task_cached and _read_json_cached
+        self._task_cache: dict[str, tuple[int, TaskFile]] = {}
+        self._json_cache: dict[Path, tuple[int, Any]] = {}
+        # Entries of append-only JSONL sidecars with the byte offset read up
+        # to; see _read_jsonl_cached
+        self._jsonl_cache: dict[Path, tuple[int, list[Any]]] = {}
+
+        # CrewAI verbose output writes every agent step to stderr; off unless
+        # explicitly enabled
+        self.verbose = os.getenv("CAGE_CREW_VERBOSE", "false").lower() == "true"
 
         # Initialize comprehensive logging
         self.logger = logging.getLogger(__name__)
         self._setup_crewai_logging()
 
-        # Initialize modular agent system
-        self._setup_modular_agents()
+        # The modular agent system is built on first use (see _ensure_agents)
+        # so status-only callers never construct agents
+        self._agents_ready = False
+        self._agents_lock = threading.Lock()
 
     def _setup_crewai_logging(self):
         """Set up comprehensive logging for CrewAI operations."""
-        from src.cage.utils.jsonl_logger import setup_jsonl_logger
-
-        # Set up JSONL logger for crewai
-        self.crewai_logger = setup_jsonl_logger("crewai", level=logging.DEBUG)
+        from src.cage.utils.jsonl_logger import get_jsonl_logger, setup_jsonl_logger
+
+        # Keep a crewai JSONL logger the application already configured (the
+        # crew service sets one up at startup); replacing it would close its
+        # handler and override its level
+        crewai_logger = get_jsonl_logger("crewai")
+        if not crewai_logger.handlers:
+            # Buffered: verbose runs log many small records in tight loops
+            crewai_logger = setup_jsonl_logger(
+                "crewai", level=logging.DEBUG, buffer_capacity=512
+            )
+        self.crewai_logger = crewai_logger
 
         self.logger.info("CrewAI JSONL logging initialized")
 
     def _setup_modular_agents(self):
         """Set up the modular agent system."""
         self.logger.info("Setting up modular agent system...")
+        from ..agents import AgentFactory, AgentRegistry, CrewBuilder
+        from ..agents.config import AgentConfigManager
+
+        # Tool wrappers shared by every agent this tool creates
+        self._editor_wrapper = EditorToolWrapper(self.editor_tool)
+        self._git_wrapper = GitToolWrapper(self.git_tool)
 
         # Initialize agent registry
-        self.agent_registry = AgentRegistry(logger=self.logger)
+        self._agent_registry = AgentRegistry(logger=self.logger)
 
         # Initialize agent factory
-        self.agent_factory = AgentFactory(self.agent_registry, logger=self.logger)
+        self._agent_factory = AgentFactory(self._agent_registry, logger=self.logger)
 
         # Initialize crew builder
-        self.crew_builder = CrewBuilder(self.agent_factory, logger=self.logger)
+        self._crew_builder = CrewBuilder(self._agent_factory, logger=self.logger)
 
         # Initialize configuration manager
-        self.config_manager = AgentConfigManager(logger=self.logger)
+        self._config_manager = AgentConfigManager(logger=self.logger)
 
         # Register default agents
         self._register_default_agents()
 
         self.logger.info("Modular agent system initialized successfully")
 
+    def _ensure_agents(self) -> None:
+        """Set up the modular agent system once, on first use."""
+        if self._agents_ready:
+            return
+        with self._agents_lock:
+            if not self._agents_ready:
+                self._setup_modular_agents()
+                self._agents_ready = True
+
+    @property
+    def agent_registry(self) -> "AgentRegistry":
+        """Registry of available agents."""
+        self._ensure_agents()
+        return self._agent_registry
+
+    @property
+    def agent_factory(self) -> "AgentFactory":
+        """Factory creating agents from the registry."""
+        self._ensure_agents()
+        return self._agent_factory
+
+    @property
+    def crew_builder(self) -> "CrewBuilder":
+        """Builder for crews of registered agents."""
+        self._ensure_agents()
+        return self._crew_builder
+
+    @property
+    def config_manager(self) -> "AgentConfigManager":
+        """Manager for agent configurations."""
+        self._ensure_agents()
+        return self._config_manager
+
     def _register_default_agents(self):
         """Register the default agents in the registry."""
-        # Register all default agents
-        self.agent_registry.register_agent(PlannerAgent, planner_config, "planner")
-        self.agent_registry.register_agent(
-            ImplementerAgent, implementer_config, "implementer"
-        )
-        self.agent_registry.register_agent(ReviewerAgent, reviewer_config, "reviewer")
-        self.agent_registry.register_agent(VerifierAgent, verifier_config, "verifier")
-        self.agent_registry.register_agent(
-            CommitterAgent, committer_config, "committer"
+        from ..agents.committer import CommitterAgent, get_committer_config
+        from ..agents.implementer import ImplementerAgent, get_implementer_config
+        from ..agents.planner import PlannerAgent, get_planner_config
+        from ..agents.reviewer import ReviewerAgent
+        from ..agents.verifier import VerifierAgent
+
+        # Register all default agents, with this tool's verbosity
+        default_agents = (
+            (PlannerAgent, get_planner_config(), "planner"),
+            (ImplementerAgent, get_implementer_config(), "implementer"),
+            (ReviewerAgent, ReviewerAgent.create_default_config(), "reviewer"),
+            (VerifierAgent, VerifierAgent.create_default_config(), "verifier"),
+            (CommitterAgent, get_committer_config(), "committer"),
         )
+        for agent_class, config, name in default_agents:
+            self._agent_registry.register_agent(
+                agent_class, replace(config, verbose=self.verbose), name
+            )
+
+        self.logger.info(f"Registered {len(self._agent_registry)} default agents")
 
-        self.logger.info(f"Registered {len(self.agent_registry)} default agents")
+    def _cached_now(self) -> str:
+        """
+        Get the current time as an ISO timestamp, refreshed at most every 1 ms.
+
+        Returns:
+            ISO 8601 timestamp string
+        """
+        cached_at, timestamp = self._ts_cache
+        now = time.monotonic()
+        if now - cached_at < 0.001:
+            return timestamp
+        timestamp = datetime.now().isoformat()
+        self._ts_cache = (now, timestamp)
+        return timestamp
 
     def _log_agent_activity(
         self, agent_name: str, activity: str, details: dict[str, Any] = None
@@ -119,10 +340,10 @@ class ModularCrewTool:
         log_data = {
             "agent": agent_name,
             "activity": activity,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._cached_now(),
             "details": details or {},
         }
-        self.crewai_logger.info(f"Agent Activity: {json.dumps(log_data)}")
+        self.crewai_logger.info("Agent Activity", extra={"json_data": log_data})
 
     def _log_crew_execution(
         self,
@@ -136,10 +357,10 @@ class ModularCrewTool:
             "crew": crew_name,
             "task": task_name,
             "status": status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._cached_now(),
             "details": details or {},
         }
-        self.crewai_logger.info(f"Crew Execution: {json.dumps(log_data)}")
+        self.crewai_logger.info("Crew Execution", extra={"json_data": log_data})
 
     def test_agent(
         self, agent_name: str, test_input: str, task_id: Optional[str] = None
@@ -171,13 +392,13 @@ class ModularCrewTool:
 
             # Inject appropriate tools based on agent type
             if agent_name in ("implementer", "reviewer", "verifier"):
-                agent.config.tools = [EditorToolWrapper(self.editor_tool)]
+                agent.update_config(tools=[self._editor_wrapper])
                 self.logger.info(f"Injected EditorTool into {agent_name} agent")
             elif agent_name == "committer":
-                agent.config.tools = [GitToolWrapper(self.git_tool)]
+                agent.update_config(tools=[self._git_wrapper])
                 self.logger.info(f"Injected GitTool into {agent_name} agent")
             elif agent_name == "planner":
-                agent.config.tools = [EditorToolWrapper(self.editor_tool)]
+                agent.update_config(tools=[self._editor_wrapper])
                 self.logger.info(f"Injected EditorTool into {agent_name} agent")
             else:
                 self.logger.info(f"No tools needed for {agent_name} agent")
@@ -201,7 +422,14 @@ class ModularCrewTool:
             self.logger.error(error_msg)
             return {"success": False, "error": error_msg, "agent_name": agent_name}
 
-    def create_plan(self, task_id: str, plan_data: dict[str, Any]) -> dict[str, Any]:
+    async def _kickoff(self, crew: "Crew") -> Any:
+        """Run a crew without blocking the event loop, bounded by max_concurrency."""
+        async with self._crew_semaphore:
+            return await crew.kickoff_async()
+
+    async def create_plan(
+        self, task_id: str, plan_data: dict[str, Any]
+    ) -> dict[str, Any]:
         """Create a detailed plan for task execution using the modular system."""
         self.logger.info(f"Starting plan creation for task {task_id}")
         self._log_agent_activity(
@@ -213,7 +441,7 @@ class ModularCrewTool:
         try:
             # Load the task
             self.logger.debug(f"Loading task {task_id}")
-            task = self.task_manager.load_task(task_id)
+            task = await asyncio.to_thread(self._load_task_cached, task_id)
             if not task:
                 error_msg = f"Task {task_id} not found"
                 self.logger.error(error_msg)
@@ -223,6 +451,7 @@ class ModularCrewTool:
                     {"task_id": task_id, "error": error_msg},
                 )
                 raise ValueError(error_msg)
+            success_texts, acceptance_texts = _criteria_texts(task)
 
             # Create run ID
             run_id = str(uuid.uuid4())
@@ -230,7 +459,7 @@ class ModularCrewTool:
 
             # Create run directory
             run_dir = self.runs_dir / run_id
-            run_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(run_dir)
             self.logger.debug(f"Created run directory: {run_dir}")
 
             # Create planner agent
@@ -239,15 +468,8 @@ class ModularCrewTool:
                 raise ValueError("Failed to create planner agent")
 
             # Create plan task
-            plan_task = Task(
-                description=planner_agent.create_plan_task(
-                    task_title=task.title,
-                    task_summary=task.summary,
-                    success_criteria=[c.text for c in task.success_criteria],
-                    acceptance_checks=[c.text for c in task.acceptance_checks],
-                ),
-                agent=planner_agent.get_agent(),
-                expected_output="A detailed JSON plan with Cage-native API calls, validation steps, and rollback paths",
+            plan_task = self._create_plan_task(
+                planner_agent, task.title, task.summary, success_texts, acceptance_texts
             )
 
             # Execute planning crew
@@ -263,9 +485,10 @@ class ModularCrewTool:
                 self.crew_builder.reset()
                 .add_agent(planner_agent)
                 .add_task(plan_task)
+                .set_verbose(self.verbose)
                 .build()
             )
-            result = planning_crew.kickoff()
+            result = await self._kickoff(planning_crew)
 
             self.logger.info("Planning crew execution completed")
             self._log_crew_execution(
@@ -280,29 +503,14 @@ class ModularCrewTool:
             self.logger.debug(f"Plan content length: {len(plan_content)} characters")
 
             # Save plan to run directory
-            plan_file = run_dir / "plan.json"
-            plan_data_to_save = {
-                "run_id": run_id,
-                "task_id": task_id,
-                "created_at": datetime.now().isoformat(),
-                "plan": plan_content,
-                "raw_plan_data": plan_data,
-            }
-
-            with open(plan_file, "w") as f:
-                json.dump(plan_data_to_save, f, indent=2)
-
-            self.logger.info(f"Plan saved to: {plan_file}")
-
-            # Update task with plan
-            task_data = task.model_dump()
-            task_data["plan"] = {
-                "run_id": run_id,
-                "created_at": datetime.now().isoformat(),
-                "plan": plan_content,
-            }
+            plan_pointer = await self._save_plan(
+                run_id, task_id, plan_content, plan_data
+            )
+            plan_file = self.repo_path / plan_pointer["plan_path"]
 
-            self.task_manager.update_task(task_id, task_data)
+            # Update task with a pointer to the plan; the content stays in
+            # plan.json so task updates don't rewrite it (see get_plan)
+            await asyncio.to_thread(self._update_task, task_id, {"plan": plan_pointer})
             self.logger.info(f"Task {task_id} updated with plan information")
 
             self._log_agent_activity(
@@ -337,17 +545,179 @@ class ModularCrewTool:
             )
             return {"status": "error", "error": str(e)}
 
-    def apply_plan(self, task_id: str, run_id: Optional[str] = None) -> dict[str, Any]:
+    def _create_plan_task(
+        self,
+        planner_agent: Any,
+        task_title: str,
+        task_summary: str,
+        success_texts: tuple[str, ...],
+        acceptance_texts: tuple[str, ...],
+    ) -> "Task":
+        """Create the planner's task for a Cage task."""
+        from crewai import Task
+
+        return Task(
+            description=planner_agent.create_plan_task(
+                task_title=task_title,
+                task_summary=task_summary,
+                success_criteria=success_texts,
+                acceptance_checks=acceptance_texts,
+            ),
+            agent=planner_agent.get_agent(),
+            expected_output="A detailed JSON plan with Cage-native API calls, validation steps, and rollback paths",
+        )
+
+    async def _save_plan(
+        self,
+        run_id: str,
+        task_id: str,
+        plan_content: str,
+        plan_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Save a plan to its run directory.
+
+        Args:
+            run_id: ID of the run the plan belongs to
+            task_id: ID of the planned task
+            plan_content: The plan JSON produced by the planner
+            plan_data: Planning input, saved alongside the plan
+
+        Returns:
+            Pointer to the saved plan, as stored in the task's plan field
+        """
+        # Parse and validate once; apply_plan consumes the structured plan
+        structured_plan = self._parse_structured_plan(plan_content)
+        if structured_plan is None:
+            self.logger.warning(
+                f"Plan for task {task_id} is not a valid Cage plan; "
+                "it will be applied as raw text"
+            )
+
+        created_at = self._cached_now()
+        plan_file = self.runs_dir / run_id / "plan.json"
+        plan_data_to_save = {
+            "run_id": run_id,
+            "task_id": task_id,
+            "created_at": created_at,
+            "plan": plan_content,
+            "structured_plan": structured_plan,
+            "raw_plan_data": plan_data,
+        }
+
+        await asyncio.to_thread(
+            self._write_in_dir,
+            plan_file.parent,
+            json_codec.write_json_atomic,
+            plan_file,
+            plan_data_to_save,
+        )
+
+        self.logger.info(f"Plan saved to: {plan_file}")
+
+        return {
+            "run_id": run_id,
+            "created_at": created_at,
+            "plan_path": str(plan_file.relative_to(self.repo_path)),
+        }
+
+    async def apply_plans_bulk(self, task_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        Apply the current plans of several tasks concurrently.
+
+        Crew kickoffs across all plans share the max_concurrency limit.
+
+        Args:
+            task_ids: IDs of tasks whose plans should be applied
+
+        Returns:
+            Results of apply_plan, in the order of task_ids
+        """
+        return await asyncio.gather(
+            *(self.apply_plan(task_id) for task_id in task_ids)
+        )
+
+    async def apply_plan(
+        self, task_id: str, run_id: Optional[str] = None
+    ) -> dict[str, Any]:
         """Execute a plan using the modular crew system with validation loops."""
+        return await self._execute_plan(task_id, run_id)
+
+    async def create_and_apply(
+        self, task_id: str, plan_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Create and execute a plan for a task in one pass.
+
+        Planning runs as the first task of the initial implementation crew,
+        and the implementer receives the plan as task context, so planning
+        does not need a crew kickoff of its own. The plan is saved and
+        referenced from the task as with create_plan.
+
+        Because the plan does not exist until the crew is running, the
+        initial implementation is a single implementer task: it is not fanned
+        out over plan steps that touch disjoint files, as apply_plan does.
+        Use create_plan followed by apply_plan for large plans that benefit
+        from parallel implementers.
+
+        Args:
+            task_id: ID of the task to plan and execute
+            plan_data: Planning input, saved alongside the plan
+
+        Returns:
+            Result dictionary, as returned by apply_plan
+        """
+        return await self._execute_plan(task_id, None, planning_input=plan_data)
+
+    async def _execute_plan(
+        self,
+        task_id: str,
+        run_id: Optional[str],
+        planning_input: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Execute a plan, writing the task file once for the whole run."""
+        # Editor operations made by the crews carry the task ID in their
+        # correlation ID, so EditorTool logs them to the task changelog; those
+        # entries are written together with the final task update. Crew
+        # kickoffs run in worker threads that copy this context.
+        token = _RUN_TASK_ID.set(task_id)
+        try:
+            with self.task_manager.batch_updates(task_id):
+                return await self._run_plan(task_id, run_id, planning_input)
+        finally:
+            _RUN_TASK_ID.reset(token)
+
+    async def _run_plan(
+        self,
+        task_id: str,
+        run_id: Optional[str],
+        planning_input: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """
+        Execute a plan using the modular crew system with validation loops.
+
+        Args:
+            task_id: ID of the task
+            run_id: Run whose saved plan to execute; defaults to the run of
+                the task's latest plan
+            planning_input: If given, a new plan is created by the initial
+                implementation crew instead of loading a saved one
+
+        Returns:
+            Result dictionary with validation and commit outcomes
+        """
         self.logger.info(f"Starting plan application for task {task_id}, run {run_id}")
         self._log_agent_activity(
             "Crew", "Plan Application Started", {"task_id": task_id, "run_id": run_id}
         )
 
+        from crewai import Process, Task
+
+        run_status: Optional[RunStatus] = None
         try:
             # Load the task
             self.logger.debug(f"Loading task {task_id}")
-            task = self.task_manager.load_task(task_id)
+            task = await asyncio.to_thread(self._load_task_cached, task_id)
             if not task:
                 error_msg = f"Task {task_id} not found"
                 self.logger.error(error_msg)
@@ -358,54 +728,59 @@ class ModularCrewTool:
                 )
                 raise ValueError(error_msg)
 
-            # Get run ID
-            if not run_id:
-                if hasattr(task, "plan") and task.plan:
-                    run_id = task.plan.get("run_id")
-                    self.logger.info(f"Using run_id from task plan: {run_id}")
-                else:
-                    error_msg = "No run_id provided and no plan found in task"
+            success_texts, acceptance_texts = _criteria_texts(task)
+
+            plan_data: Optional[dict[str, Any]] = None
+            if planning_input is None:
+                # Get run ID
+                if not run_id:
+                    if task.plan.run_id:
+                        run_id = task.plan.run_id
+                        self.logger.info(f"Using run_id from task plan: {run_id}")
+                    else:
+                        error_msg = "No run_id provided and no plan found in task"
+                        self.logger.error(error_msg)
+                        self._log_agent_activity(
+                            "Crew",
+                            "Plan Application Failed",
+                            {"task_id": task_id, "error": error_msg},
+                        )
+                        raise ValueError(error_msg)
+
+                # Load plan
+                run_dir = self.runs_dir / run_id
+                plan_file = run_dir / "plan.json"
+
+                if not plan_file.exists():
+                    error_msg = f"Plan file not found for run {run_id}"
                     self.logger.error(error_msg)
                     self._log_agent_activity(
                         "Crew",
                         "Plan Application Failed",
-                        {"task_id": task_id, "error": error_msg},
+                        {"task_id": task_id, "run_id": run_id, "error": error_msg},
                     )
                     raise ValueError(error_msg)
 
-            # Load plan
-            run_dir = self.runs_dir / run_id
-            plan_file = run_dir / "plan.json"
-
-            if not plan_file.exists():
-                error_msg = f"Plan file not found for run {run_id}"
-                self.logger.error(error_msg)
-                self._log_agent_activity(
-                    "Crew",
-                    "Plan Application Failed",
-                    {"task_id": task_id, "run_id": run_id, "error": error_msg},
+                self.logger.info(f"Loading plan from: {plan_file}")
+                plan_data = await asyncio.to_thread(self._read_json_cached, plan_file)
+                self.logger.debug(
+                    f"Plan data loaded successfully, plan length: {len(plan_data.get('plan', ''))}"
                 )
-                raise ValueError(error_msg)
-
-            self.logger.info(f"Loading plan from: {plan_file}")
-            with open(plan_file) as f:
-                plan_data = json.load(f)
-            self.logger.debug(
-                f"Plan data loaded successfully, plan length: {len(plan_data.get('plan', ''))}"
-            )
+            else:
+                run_id = str(uuid.uuid4())
+                self._ensure_dir(self.runs_dir / run_id)
+                self.logger.info(f"Created run ID: {run_id}")
 
             # Create run status
             run_status = RunStatus(
                 run_id=run_id,
                 task_id=task_id,
                 status="running",
-                started_at=datetime.now(),
-                logs=[],
-                artefacts=[],
+                started_at_ns=time.time_ns(),
             )
 
             # Save initial run status
-            self._save_run_status(run_status)
+            await asyncio.to_thread(self._save_run_status, run_status)
             self.logger.info(f"Run status created and saved for run {run_id}")
 
             # Prepare criteria mapping for validation
@@ -415,26 +790,54 @@ class ModularCrewTool:
             # Create execution agents with tools
             implementer_agent = self.agent_factory.create_agent("implementer")
             reviewer_agent = self.agent_factory.create_agent("reviewer")
-            verifier_agent = self.agent_factory.create_agent("verifier")
+            # The verifier checks structured criteria against the repository
+            verifier_agent = self.agent_factory.create_agent(
+                "verifier", repo_path=self.repo_path
+            )
             committer_agent = self.agent_factory.create_agent("committer")
 
-            implementer_agent.config.tools = [EditorToolWrapper(self.editor_tool)]
-            reviewer_agent.config.tools = [EditorToolWrapper(self.editor_tool)]
-            verifier_agent.config.tools = [EditorToolWrapper(self.editor_tool)]
-            committer_agent.config.tools = [GitToolWrapper(self.git_tool)]
+            implementer_agent.update_config(tools=[self._editor_wrapper])
+            reviewer_agent.update_config(tools=[self._editor_wrapper])
+            verifier_agent.update_config(tools=[self._editor_wrapper])
+            committer_agent.update_config(tools=[self._git_wrapper])
 
             implementer_agent.initialize()
             reviewer_agent.initialize()
             verifier_agent.initialize()
             committer_agent.initialize()
 
-            def run_impl_review(
-                implementation_description: str,
+            # Implementers for parallel plan step groups, one per group
+            implementer_agents = [implementer_agent]
+
+            def get_implementers(count: int) -> list[Any]:
+                """Get ``count`` initialized implementers, creating clones as needed."""
+                while len(implementer_agents) < count:
+                    clone = self.agent_factory.create_agent("implementer")
+                    clone.update_config(tools=[self._editor_wrapper])
+                    clone.initialize()
+                    implementer_agents.append(clone)
+                return implementer_agents[:count]
+
+            async def run_impl_review(
+                implementation_descriptions: list[str],
                 review_description: str,
                 iteration: int,
                 stage: str,
+                planning: Optional[tuple[Any, Task]] = None,
             ) -> Any:
-                """Run the implementation + review crew for a given iteration."""
+                """
+                Run the implementation + review crew for a given iteration.
+
+                Several implementation descriptions run as concurrent tasks on
+                separate implementers; the review waits for all of them. With
+                ``planning`` (planner agent, plan task), the plan task runs
+                first and is passed to every implementation task as context.
+                """
+                lead_agents: list[Any] = []
+                lead_tasks: list[Task] = []
+                if planning is not None:
+                    lead_agents, lead_tasks = [planning[0]], [planning[1]]
+
                 crew_name = f"{stage} Crew"
                 self.logger.info(
                     f"Starting {stage.lower()} iteration {iteration} for run {run_id}"
@@ -448,32 +851,43 @@ class ModularCrewTool:
                         "task_id": task_id,
                         "iteration": iteration,
                         "stage": stage.lower(),
-                        "agents": ["implementer", "reviewer"],
+                        "agents": ["planner"] * len(lead_agents)
+                        + ["implementer", "reviewer"],
                     },
                 )
 
-                implement_task = Task(
-                    description=implementation_description,
-                    agent=implementer_agent.get_agent(),
-                    expected_output="Confirmation of successful file operations using EditorTool and changes made",
-                )
+                parallel = len(implementation_descriptions) > 1
+                implementers = get_implementers(len(implementation_descriptions))
+                implement_tasks = [
+                    Task(
+                        description=description,
+                        agent=implementer.get_agent(),
+                        expected_output="Confirmation of successful file operations using EditorTool and changes made",
+                        async_execution=parallel,
+                        context=lead_tasks or None,
+                    )
+                    for implementer, description in zip(
+                        implementers, implementation_descriptions, strict=True
+                    )
+                ]
                 review_task = Task(
                     description=review_description,
                     agent=reviewer_agent.get_agent(),
                     expected_output="Review report confirming EditorTool usage and file quality, with approval or specific issues found",
+                    context=implement_tasks if parallel else None,
                 )
                 crew = (
                     self.crew_builder.reset()
-                    .add_agent(implementer_agent)
+                    .add_agents(lead_agents + implementers)
                     .add_agent(reviewer_agent)
-                    .add_task(implement_task)
+                    .add_tasks(lead_tasks + implement_tasks)
                     .add_task(review_task)
                     .set_process(Process.sequential)
-                    .set_verbose(True)
+                    .set_verbose(self.verbose)
                     .build()
                 )
 
-                result = crew.kickoff()
+                result = await self._kickoff(crew)
                 result_output = self._extract_result_output(result)
                 self._log_crew_execution(
                     crew_name,
@@ -488,23 +902,32 @@ class ModularCrewTool:
                         "result_length": len(result_output),
                     },
                 )
-                run_status.logs.append(
-                    f"{stage} iteration {iteration}: {result_output}"
+                await asyncio.to_thread(
+                    self._append_log,
+                    run_id,
+                    f"{stage} iteration {iteration}: {result_output}",
                 )
                 return result
 
-            def run_verification(iteration: int) -> Any:
-                """Execute the verification crew for the current iteration."""
+            async def run_verification(iteration: int) -> tuple[Any, list]:
+                """
+                Execute the verification crew for the current iteration.
+
+                Returns the crew result and the results of criteria the
+                verifier checked without the LLM.
+                """
                 crew_name = "Verification Crew"
                 self.logger.info(
                     f"Starting verification iteration {iteration} for run {run_id}"
                 )
+                description, rule_results = await asyncio.to_thread(
+                    verifier_agent.prepare_verification,
+                    task.title,
+                    success_texts,
+                    acceptance_texts,
+                )
                 verify_task = Task(
-                    description=verifier_agent.create_verification_task(
-                        task.title,
-                        [c.text for c in task.success_criteria],
-                        [c.text for c in task.acceptance_checks],
-                    ),
+                    description=description,
                     agent=verifier_agent.get_agent(),
                     expected_output="Detailed validation report with PASS/FAIL for each acceptance criterion",
                 )
@@ -524,10 +947,10 @@ class ModularCrewTool:
                     .add_agent(verifier_agent)
                     .add_task(verify_task)
                     .set_process(Process.sequential)
-                    .set_verbose(True)
+                    .set_verbose(self.verbose)
                     .build()
                 )
-                result = crew.kickoff()
+                result = await self._kickoff(crew)
                 result_output = self._extract_result_output(result)
                 self._log_crew_execution(
                     crew_name,
@@ -541,22 +964,75 @@ class ModularCrewTool:
                         "result_length": len(result_output),
                     },
                 )
-                run_status.logs.append(
-                    f"Verification iteration {iteration}: {result_output}"
+                await asyncio.to_thread(
+                    self._append_log,
+                    run_id,
+                    f"Verification iteration {iteration}: {result_output}",
                 )
-                return result
+                return result, rule_results
 
-            # Initial implementation pass
-            initial_impl_description = implementer_agent.create_implementation_task(
-                task_title=task.title, plan_content=plan_data.get("plan", "")
-            )
             initial_review_description = reviewer_agent.create_review_task(task.title)
-            run_impl_review(
-                initial_impl_description,
-                initial_review_description,
-                1,
-                "Implementation",
-            )
+            plan_pointer: Optional[dict[str, Any]] = None
+            if planning_input is None:
+                # Initial implementation pass, fanned out over groups of plan steps
+                # that touch disjoint files
+                plan_content = plan_data.get("plan", "")
+                if "structured_plan" in plan_data:
+                    structured_plan = plan_data["structured_plan"]
+                else:
+                    # Plan saved before structured plans were stored
+                    structured_plan = self._parse_structured_plan(plan_content)
+                step_groups = self._partition_plan_steps(structured_plan)
+                if len(step_groups) > 1:
+                    initial_impl_descriptions = [
+                        implementer_agent.create_implementation_task(
+                            task_title=task.title, plan_content=group_plan
+                        )
+                        for group_plan in step_groups
+                    ]
+                else:
+                    initial_impl_descriptions = [
+                        implementer_agent.create_implementation_task(
+                            task_title=task.title, plan_content=plan_content
+                        )
+                    ]
+                await run_impl_review(
+                    initial_impl_descriptions,
+                    initial_review_description,
+                    1,
+                    "Implementation",
+                )
+            else:
+                # Plan inside the initial implementation crew. The steps are
+                # unknown when the crew is built, so a single implementer
+                # follows the whole plan instead of one per step group.
+                planner_agent = self.agent_factory.create_agent("planner")
+                if not planner_agent:
+                    raise ValueError("Failed to create planner agent")
+                plan_task = self._create_plan_task(
+                    planner_agent,
+                    task.title,
+                    task.summary,
+                    success_texts,
+                    acceptance_texts,
+                )
+                await run_impl_review(
+                    [
+                        implementer_agent.create_implementation_task(
+                            task_title=task.title, plan_content=_FUSED_PLAN_REFERENCE
+                        )
+                    ],
+                    initial_review_description,
+                    1,
+                    "Planning and Implementation",
+                    planning=(planner_agent, plan_task),
+                )
+                plan_pointer = await self._save_plan(
+                    run_id,
+                    task_id,
+                    self._extract_result_output(plan_task.output),
+                    planning_input,
+                )
 
             verification_history: list[dict[str, Any]] = []
             validation: Optional[dict[str, Any]] = None
@@ -582,12 +1058,17 @@ class ModularCrewTool:
                 }
             else:
                 while verification_iteration <= max_iterations:
-                    verification_result = run_verification(verification_iteration)
+                    verification_result, rule_results = await run_verification(
+                        verification_iteration
+                    )
                     verification_output = self._extract_result_output(
                         verification_result
                     )
                     validation = self._parse_verification_output(
-                        verification_output, criteria_map, criteria_order
+                        verification_output,
+                        criteria_map,
+                        criteria_order,
+                        rule_results,
                     )
                     verification_history.append(
                         {
@@ -612,8 +1093,8 @@ class ModularCrewTool:
                         reviewer_agent.create_review_task(task.title)
                         + "\n\nAdditional Focus: Ensure the fixes address each failed criterion listed in the implementer instructions."
                     )
-                    run_impl_review(
-                        remediation_description,
+                    await run_impl_review(
+                        [remediation_description],
                         remediation_review_description,
                         verification_iteration + 1,
                         "Remediation",
@@ -638,9 +1119,13 @@ class ModularCrewTool:
                         "unmatched": [],
                     }
 
-            verification_timestamp = datetime.now().isoformat()
+            verification_timestamp = self._cached_now()
 
-            task_data = task.model_dump()
+            # Only the fields rewritten below are dumped; update_task merges
+            # them into the stored task
+            task_data = task.model_dump(include=_VERIFICATION_FIELDS)
+            if plan_pointer is not None:
+                task_data["plan"] = plan_pointer
             result_lookup = {
                 (item["source"], item["index"]): item for item in validation["results"]
             }
@@ -676,7 +1161,7 @@ class ModularCrewTool:
                     .add_agent(committer_agent)
                     .add_task(commit_task)
                     .set_process(Process.sequential)
-                    .set_verbose(True)
+                    .set_verbose(self.verbose)
                     .build()
                 )
                 self._log_crew_execution(
@@ -690,7 +1175,7 @@ class ModularCrewTool:
                     },
                 )
                 try:
-                    commit_result = commit_crew.kickoff()
+                    commit_result = await self._kickoff(commit_crew)
                     commit_output = self._extract_result_output(commit_result)
                     commit_success = True
                     self._log_crew_execution(
@@ -705,7 +1190,9 @@ class ModularCrewTool:
                             "result_length": len(commit_output or ""),
                         },
                     )
-                    run_status.logs.append(f"Commit: {commit_output}")
+                    await asyncio.to_thread(
+                        self._append_log, run_id, f"Commit: {commit_output}"
+                    )
                 except Exception as commit_error:
                     commit_output = str(commit_error)
                     commit_success = False
@@ -721,10 +1208,14 @@ class ModularCrewTool:
                             "error": commit_output,
                         },
                     )
-                    run_status.logs.append(f"Commit failed: {commit_output}")
+                    await asyncio.to_thread(
+                        self._append_log, run_id, f"Commit failed: {commit_output}"
+                    )
 
             summary = validation["summary"]
-            task_data["changelog"].append(
+            # Queued by the run's batch and written with the task update below
+            self.task_manager.append_changelog(
+                task_id,
                 {
                     "timestamp": verification_timestamp,
                     "text": (
@@ -733,7 +1224,7 @@ class ModularCrewTool:
                         f"{summary['PARTIAL']} partial, {summary['FAIL']} failed, "
                         f"{summary['MISSING']} missing."
                     ),
-                }
+                },
             )
 
             task_data.setdefault("issues_risks", [])
@@ -767,7 +1258,9 @@ class ModularCrewTool:
                 "unmatched": validation.get("unmatched", []),
             }
 
-            updated_task = self.task_manager.update_task(task_id, task_data)
+            updated_task = await asyncio.to_thread(
+                self._update_task, task_id, task_data
+            )
             if updated_task:
                 self.logger.info(
                     f"Task {task_id} updated with execution results: "
@@ -780,7 +1273,7 @@ class ModularCrewTool:
                     f"Failed to update task {task_id} with validation results"
                 )
 
-            run_status.completed_at = datetime.now()
+            run_status.completed_at_ns = time.time_ns()
             if validation["all_passed"] and commit_success:
                 run_status.status = "completed"
             elif validation["all_passed"]:
@@ -790,7 +1283,7 @@ class ModularCrewTool:
                 run_status.status = "failed"
                 run_status.error = "Acceptance validation failed"
 
-            self._save_run_status(run_status)
+            await asyncio.to_thread(self._save_run_status, run_status)
             self.logger.info(
                 f"Run status updated to {run_status.status} for run {run_id}"
             )
@@ -846,32 +1339,85 @@ class ModularCrewTool:
                 },
             )
 
-            if "run_status" in locals():
+            if run_status is not None:
                 run_status.status = "failed"
-                run_status.completed_at = datetime.now()
+                run_status.completed_at_ns = time.time_ns()
                 run_status.error = str(e)
-                self._save_run_status(run_status)
+                await asyncio.to_thread(self._save_run_status, run_status)
                 self.logger.info(f"Run status updated to failed for run {run_id}")
 
             return {"status": "error", "error": str(e)}
 
+    @staticmethod
+    def _parse_structured_plan(plan_content: str) -> Optional[dict[str, Any]]:
+        """
+        Parse planner output into a schema-valid Cage plan.
+
+        Args:
+            plan_content: The plan JSON produced by the planner
+
+        Returns:
+            The parsed plan, or None if it is not valid JSON or fails
+            schema validation
+        """
+        from ..agents.planner import parse_plan_output
+
+        plan, schema_error = parse_plan_output(plan_content)
+        if schema_error or "raw_output" in plan:
+            return None
+        return plan
+
+    @staticmethod
+    def _partition_plan_steps(plan: Optional[dict[str, Any]]) -> list[str]:
+        """
+        Split a plan into sub-plans whose steps touch disjoint files.
+
+        Steps are grouped by the file path in their request body, keeping
+        plan order within each group, so groups can be implemented
+        concurrently. If there is no valid plan, or any step has no file
+        path (and so may depend on other steps), the plan is kept whole.
+
+        Args:
+            plan: Structured plan from _parse_structured_plan
+
+        Returns:
+            List of sub-plan JSON strings, or an empty list if the plan
+            cannot be partitioned
+        """
+        if plan is None:
+            return []
+
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for step in plan["steps"]:
+            body = step["request"].get("body")
+            path = body.get("path") if isinstance(body, dict) else None
+            if not isinstance(path, str):
+                return []
+            groups.setdefault(path, []).append(step)
+
+        return [
+            json_codec.dumps({**plan, "steps": steps}, indent=True)
+            for steps in groups.values()
+        ]
+
     def create_custom_crew(
         self,
         agent_names: list[str],
-        tasks: list[Task],
-        process: Process = Process.sequential,
-    ) -> Crew:
+        tasks: list["Task"],
+        process: Optional["Process"] = None,
+    ) -> "Crew":
         """
         Create a custom crew with specified agents and tasks.
 
         Args:
             agent_names: List of agent names to include
             tasks: List of tasks for the crew
-            process: Crew process type
+            process: Crew process type; defaults to sequential
 
         Returns:
             Built CrewAI crew
         """
+        from crewai import Process
         self.logger.info(f"Creating custom crew with agents: {agent_names}")
 
         # Create crew builder
@@ -883,9 +1429,9 @@ class ModularCrewTool:
             if agent:
                 # Inject appropriate tools
                 if agent_name in ("implementer", "reviewer", "verifier"):
-                    agent.config.tools = [EditorToolWrapper(self.editor_tool)]
+                    agent.update_config(tools=[self._editor_wrapper])
                 elif agent_name == "committer":
-                    agent.config.tools = [GitToolWrapper(self.git_tool)]
+                    agent.update_config(tools=[self._git_wrapper])
 
                 # Reinitialize with tools
                 agent.initialize()
@@ -898,7 +1444,8 @@ class ModularCrewTool:
             builder.add_task(task)
 
         # Set process and build
-        crew = builder.set_process(process).set_verbose(True).build()
+        process = process or Process.sequential
+        crew = builder.set_process(process).set_verbose(self.verbose).build()
 
         self.logger.info(
             f"Custom crew created with {len(crew.agents)} agents and {len(crew.tasks)} tasks"
@@ -926,6 +1473,33 @@ class ModularCrewTool:
         """
         return self.agent_registry.get_agent_info(agent_name)
 
+    def get_plan(self, task_id: str) -> dict[str, Any]:
+        """
+        Get the latest plan created for a task.
+
+        Tasks only store a pointer to their plan file, so the content is read
+        here on demand.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            Result dictionary with the saved plan data
+        """
+        try:
+            task = self._load_task_cached(task_id)
+            if not task:
+                return {"status": "error", "error": f"Task {task_id} not found"}
+            if not task.plan.plan_path:
+                return {"status": "error", "error": f"Task {task_id} has no plan"}
+
+            plan_data = self._read_json_cached(self.repo_path / task.plan.plan_path)
+            return {"status": "success", "plan_data": plan_data}
+
+        except Exception as e:
+            self.logger.error(f"Error getting plan for task {task_id}: {e}")
+            return {"status": "error", "error": str(e)}
+
     def get_run_status(self, run_id: str) -> dict[str, Any]:
         """Get the status of a crew run."""
         try:
@@ -934,8 +1508,12 @@ class ModularCrewTool:
             if not run_file.exists():
                 return {"status": "error", "error": f"Run {run_id} not found"}
 
-            with open(run_file) as f:
-                status_data = json.load(f)
+            status_data = dict(self._read_json_cached(run_file))
+            # Runs written before the sidecar files keep their inline lists
+            for key in ("logs", "artefacts"):
+                sidecar = run_file.with_name(f"{key}.jsonl")
+                if sidecar.exists():
+                    status_data[key] = self._read_jsonl_cached(sidecar)
 
             return {"status": "success", "run_data": status_data}
 
@@ -943,34 +1521,44 @@ class ModularCrewTool:
             self.logger.error(f"Error getting run status for {run_id}: {e}")
             return {"status": "error", "error": str(e)}
 
-    def upload_artefacts(self, run_id: str, files: dict[str, str]) -> dict[str, Any]:
+    async def upload_artefacts(
+        self, run_id: str, files: dict[str, str]
+    ) -> dict[str, Any]:
         """Upload artefacts to a run directory."""
         try:
             run_dir = self.runs_dir / run_id
             artefacts_dir = run_dir / "artefacts"
-            artefacts_dir.mkdir(parents=True, exist_ok=True)
-
-            uploaded_files = []
-
-            for filename, content in files.items():
-                file_path = artefacts_dir / filename
-                with open(file_path, "w") as f:
-                    f.write(content)
-                uploaded_files.append(str(file_path.relative_to(self.repo_path)))
-
-            # Update run status with artefacts
-            run_file = run_dir / "status.json"
-            if run_file.exists():
-                with open(run_file) as f:
-                    status_data = json.load(f)
-
-                if "artefacts" not in status_data:
-                    status_data["artefacts"] = []
-
-                status_data["artefacts"].extend(uploaded_files)
-
-                with open(run_file, "w") as f:
-                    json.dump(status_data, f, indent=2)
+            file_paths = [artefacts_dir / filename for filename in files]
+
+            # Write files concurrently off the event loop, in one batch per
+            # worker so large uploads don't schedule a future per file
+            items = list(zip(file_paths, files.values(), strict=True))
+            batch_count = min(len(items), _FILE_WRITE_WORKERS)
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        _FILE_WRITE_EXECUTOR,
+                        self._write_in_dir,
+                        artefacts_dir,
+                        self._write_files,
+                        items[start::batch_count],
+                    )
+                    for start in range(batch_count)
+                )
+            )
+            uploaded_files = [
+                str(file_path.relative_to(self.repo_path)) for file_path in file_paths
+            ]
+
+            # Record artefacts in the run's sidecar
+            await asyncio.to_thread(
+                self._write_in_dir,
+                run_dir,
+                self._append_jsonl,
+                run_dir / "artefacts.jsonl",
+                uploaded_files,
+            )
 
             self.logger.info(
                 f"Uploaded {len(uploaded_files)} artefacts to run {run_id}"
@@ -986,6 +1574,62 @@ class ModularCrewTool:
             self.logger.error(f"Error uploading artefacts for run {run_id}: {e}")
             return {"status": "error", "error": str(e)}
 
+    @staticmethod
+    def _write_files(items: list[tuple[Path, str]]) -> None:
+        """Write text files one after another."""
+        for file_path, content in items:
+            file_path.write_text(content)
+
+    @staticmethod
+    def _append_jsonl(path: Path, entries: list[Any]) -> None:
+        """Append entries to a JSONL file, one JSON document per line."""
+        data = b"".join(json_codec.dumps_bytes(entry) + b"\n" for entry in entries)
+        with open(path, "ab") as f:
+            f.write(data)
+
+    def _read_jsonl_cached(self, path: Path) -> list[Any]:
+        """
+        Read all entries of an append-only JSONL file.
+
+        Entries already read are kept in memory, so repeated reads only parse
+        lines appended since the last call.
+
+        Args:
+            path: JSONL file to read
+
+        Returns:
+            A new list of the file's entries, empty if it does not exist
+        """
+        offset, entries = self._jsonl_cache.get(path, (0, []))
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() < offset:
+                    # Rewritten rather than appended to; start over
+                    offset, entries = 0, []
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            self._jsonl_cache.pop(path, None)
+            return []
+
+        # Leave a partially written last line for the next read
+        end = data.rfind(b"\n") + 1
+        if end:
+            entries.extend(
+                json_codec.loads(line)
+                for line in data[:end].splitlines()
+                if line.strip()
+            )
+            offset += end
+        self._jsonl_cache[path] = (offset, entries)
+        return list(entries)
+
+    def _append_log(self, run_id: str, entry: str) -> None:
+        """Append a log entry to a run's logs.jsonl sidecar."""
+        run_dir = self.runs_dir / run_id
+        self._write_in_dir(run_dir, self._append_jsonl, run_dir / "logs.jsonl", [entry])
+
     def _prepare_criteria_map(
         self, task: TaskFile
     ) -> tuple[dict[str, list[dict[str, Any]]], list[tuple[str, int]]]:
@@ -1028,8 +1672,22 @@ class ModularCrewTool:
         output: str,
         criteria_map: dict[str, list[dict[str, Any]]],
         criteria_order: list[tuple[str, int]],
+        rule_results: Sequence[tuple[str, str, str]] = (),
     ) -> dict[str, Any]:
-        """Parse verifier output into structured validation results."""
+        """
+        Parse verifier output into structured validation results.
+
+        Args:
+            output: Verifier output text
+            criteria_map: Criteria by normalized text, from _prepare_criteria_map
+            criteria_order: Order of criteria, from _prepare_criteria_map
+            rule_results: (criterion, status, evidence) for criteria the
+                verifier checked without the LLM; these override whatever the
+                output says about those criteria
+
+        Returns:
+            Validation results with per-criterion status and summary counts
+        """
         assigned: dict[tuple[str, int], dict[str, Any]] = {}
         summary_counts = {
             "PASS": 0,
@@ -1116,20 +1774,42 @@ class ModularCrewTool:
                     }
                 )
 
+        # Rule checks depend only on the exact criterion text, so every
+        # occurrence of a checked criterion takes the same result
+        rule_lookup = {
+            criterion: (status, evidence)
+            for criterion, status, evidence in rule_results
+        }
+
         results: list[dict[str, Any]] = []
         for normalized, occurrence in criteria_order:
             entry_key = (normalized, occurrence)
             result_entry = assigned.get(entry_key)
 
+            lookup_entry = next(
+                (
+                    candidate
+                    for candidate in criteria_map.get(normalized, [])
+                    if candidate["occurrence"] == occurrence
+                ),
+                None,
+            )
+            rule_result = lookup_entry and rule_lookup.get(lookup_entry["text"])
+            if rule_result:
+                status, evidence = rule_result
+                result_entry = {
+                    "text": lookup_entry["text"],
+                    "source": lookup_entry["source"],
+                    "index": lookup_entry["index"],
+                    "occurrence": occurrence,
+                    "normalized": normalized,
+                    "status": status,
+                    "evidence": evidence,
+                    "file": None,
+                    "raw_status": status,
+                }
+
             if not result_entry:
-                lookup_entry = next(
-                    (
-                        candidate
-                        for candidate in criteria_map.get(normalized, [])
-                        if candidate["occurrence"] == occurrence
-                    ),
-                    None,
-                )
                 if not lookup_entry:
                     continue
                 result_entry = {
@@ -1180,11 +1860,9 @@ class ModularCrewTool:
     ) -> str:
         """Create a focused remediation task description for failed criteria."""
         if not failed_items:
-            return f"""Re-evaluate the implementation for task: {task_title}
-
-Iteration {iteration}: Verification did not succeed, but no individual failures were captured.
-Re-read all related files using the EditorTool and ensure every acceptance criterion is fully satisfied.
-Avoid placeholders and confirm all endpoints and front-end flows are complete."""
+            return _REEVALUATE_TEMPLATE.format(
+                task_title=task_title, iteration=iteration
+            )
 
         bullet_lines = []
         for item in failed_items:
@@ -1195,16 +1873,9 @@ Avoid placeholders and confirm all endpoints and front-end flows are complete.""
             )
 
         outstanding = "\n".join(bullet_lines)
-        return f"""Address outstanding acceptance criteria for task: {task_title}
-
-Iteration {iteration} outstanding items:
-{outstanding}
-
-Implementation Instructions:
-1. Use the EditorTool to UPDATE existing files—do not leave placeholders or TODO comments.
-2. Deliver complete, working functionality that satisfies each listed criterion.
-3. Validate your changes via GET operations before concluding the update.
-4. Provide intent descriptions referencing the criterion you are fixing."""
+        return _REMEDIATION_TEMPLATE.format(
+            task_title=task_title, iteration=iteration, outstanding=outstanding
+        )
 
     def _extract_result_output(self, result: Any) -> str:
         """Convert crew results into a plain string for logging."""
@@ -1221,29 +1892,101 @@ Implementation Instructions:
         """Normalize criterion text for consistent matching."""
         return " ".join(text.lower().split())
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) unless already created by this tool."""
+        if path not in self._dirs_created:
+            path.mkdir(parents=True, exist_ok=True)
+            # mkdir(parents=True) created every ancestor as well
+            self._dirs_created.add(path)
+            self._dirs_created.update(path.parents)
+
+    def _write_in_dir(
+        self, directory: Path, write: Callable[..., _T], *args: Any
+    ) -> _T:
+        """
+        Run a write into a directory, creating the directory first.
+
+        Directories are only created once per tool (see _ensure_dir), so if
+        one was removed since, e.g. by cleaning the repository, the write is
+        retried once after recreating it.
+
+        Args:
+            directory: Directory the write goes to
+            write: Function performing the write
+            *args: Arguments for the write function
+
+        Returns:
+            The result of the write function
+        """
+        self._ensure_dir(directory)
+        try:
+            return write(*args)
+        except FileNotFoundError:
+            # Whatever removed the directory likely removed its siblings too
+            self._dirs_created.clear()
+            self._ensure_dir(directory)
+            return write(*args)
+
+    def _load_task_cached(self, task_id: str) -> Optional[TaskFile]:
+        """
+        Load a task, reusing the parsed model while the file is unchanged.
+
+        Args:
+            task_id: ID of the task to load
+
+        Returns:
+            The task, or None if it does not exist or is invalid
+        """
+        task_path = self.task_manager.tasks_dir / f"{task_id}.json"
+        try:
+            mtime = task_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._task_cache.pop(task_id, None)
+            return None
+
+        cached = self._task_cache.get(task_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        task = self.task_manager.load_task(task_id)
+        if task is not None:
+            self._task_cache[task_id] = (mtime, task)
+        return task
+
+    def _update_task(self, task_id: str, task_data: dict[str, Any]) -> Any:
+        """Update a task and drop its cached model."""
+        self._task_cache.pop(task_id, None)
+        return self.task_manager.update_task(task_id, task_data)
+
+    def _read_json_cached(self, path: Path) -> Any:
+        """
+        Read a JSON file, reusing the parsed data while the file is unchanged.
+
+        Callers must not mutate the returned data.
+
+        Args:
+            path: JSON file to read
+
+        Returns:
+            The parsed JSON data
+        """
+        mtime = path.stat().st_mtime_ns
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "rb") as f:
+            data = json_codec.loads(f.read())
+        self._json_cache[path] = (mtime, data)
+        return data
+
     def _save_run_status(self, run_status: RunStatus):
         """Save run status to file."""
         run_dir = self.runs_dir / run_status.run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-
         status_file = run_dir / "status.json"
-        status_data = {
-            "run_id": run_status.run_id,
-            "task_id": run_status.task_id,
-            "status": run_status.status,
-            "started_at": run_status.started_at.isoformat()
-            if run_status.started_at
-            else None,
-            "completed_at": run_status.completed_at.isoformat()
-            if run_status.completed_at
-            else None,
-            "error": run_status.error,
-            "logs": run_status.logs or [],
-            "artefacts": run_status.artefacts or [],
-        }
-
-        with open(status_file, "w") as f:
-            json.dump(status_data, f, indent=2)
+        self._write_in_dir(
+            run_dir, json_codec.atomic_write_bytes, status_file, run_status.to_bytes()
+        )
 
 
 class EditorToolWrapper(BaseTool):
@@ -1278,11 +2021,22 @@ class EditorToolWrapper(BaseTool):
         "payload": {"content": "File content here"},
         "intent": "Create file in subdirectory"
     }
+
+    To run several independent operations in one call, use BATCH with the
+    operations listed in payload.ops (path is not needed):
+    {
+        "operation": "BATCH",
+        "payload": {"ops": [
+            {"operation": "INSERT", "path": "a.py", "payload": {"content": "..."}},
+            {"operation": "INSERT", "path": "b.py", "payload": {"content": "..."}}
+        ]},
+        "intent": "Create modules a and b"
+    }
     """
 
     class EditorToolArgs(BaseModel):
         operation: str
-        path: str
+        path: str = ""
         selector: Optional[dict] = None
         payload: Optional[dict] = None
         intent: str = ""
@@ -1297,55 +2051,103 @@ class EditorToolWrapper(BaseTool):
     def _run(
         self,
         operation: str,
-        path: str,
+        path: str = "",
         selector: dict = None,
         payload: dict = None,
         intent: str = "",
         dry_run: bool = False,
     ) -> str:
         """Execute a file operation through the Editor Tool."""
-        # Get the crew tool logger for detailed logging
-        crew_tool_logger = logging.getLogger(f"{__name__}.crewai")
-
-        crew_tool_logger.info(
+        _CREW_LOGGER.info(
             f"EditorToolWrapper called: operation={operation}, path={path}, intent={intent}"
         )
 
-        try:
-            # Map common operation names to valid enum values
-            operation_mapping = {
-                "CREATE": "INSERT",
-                "create": "INSERT",
-                "WRITE": "INSERT",
-                "write": "INSERT",
-                "MAKE": "INSERT",
-                "make": "INSERT",
-                "NEW": "INSERT",
-                "new": "INSERT",
-                "READ": "GET",
-                "read": "GET",
-                "VIEW": "GET",
-                "view": "GET",
-                "MODIFY": "UPDATE",
-                "modify": "UPDATE",
-                "EDIT": "UPDATE",
-                "edit": "UPDATE",
-                "CHANGE": "UPDATE",
-                "change": "UPDATE",
-                "REMOVE": "DELETE",
-                "remove": "DELETE",
-                "DELETE": "DELETE",
-                "delete": "DELETE",
-            }
+        if operation.upper() == "BATCH":
+            return self._run_batch(payload, intent, dry_run)
+        return self._execute(
+            operation,
+            path,
+            selector,
+            payload,
+            intent,
+            dry_run,
+            self._correlation_id(os.urandom(16).hex()),
+        )
+
+    def _run_batch(self, payload: Optional[dict], intent: str, dry_run: bool) -> str:
+        """
+        Execute the operations of a BATCH call in order.
+
+        Each operation reports its own result, so one failure does not stop
+        the rest of the batch.
 
-            # Use mapping if available, otherwise use the original operation
-            mapped_operation = operation_mapping.get(operation, operation)
-            crew_tool_logger.debug(
-                f"Operation mapping: {operation} -> {mapped_operation}"
+        Args:
+            payload: Tool payload with the operations under "ops"
+            intent: Default intent for operations that give none
+            dry_run: Default dry_run for operations that give none
+
+        Returns:
+            One numbered result line per operation
+        """
+        ops = (payload or {}).get("ops")
+        if not isinstance(ops, list) or not ops:
+            return '❌ BATCH requires a non-empty "ops" list in the payload'
+
+        # Operations of one batch share a correlation ID prefix
+        batch_id = self._correlation_id(os.urandom(8).hex())
+        results = []
+        for index, op in enumerate(ops):
+            if not isinstance(op, dict):
+                results.append(f"[{index}] ❌ Invalid operation: {op!r}")
+                continue
+            message = self._execute(
+                str(op.get("operation", "")),
+                str(op.get("path", "")),
+                op.get("selector"),
+                op.get("payload"),
+                op.get("intent") or intent,
+                bool(op.get("dry_run", dry_run)),
+                f"{batch_id}.{index}",
             )
+            results.append(f"[{index}] {message}")
+        return "\n".join(results)
+
+    @staticmethod
+    def _correlation_id(suffix: str) -> str:
+        """
+        Build a correlation ID, tied to the running task if there is one.
 
-            # Convert operation string to enum
-            operation_type = OperationType(mapped_operation)
+        EditorTool logs operations whose ID has the form
+        "task-{task_id}-{suffix}" to the task changelog, taking the task ID
+        up to the last "-", so the suffix must not contain one.
+        """
+        task_id = _RUN_TASK_ID.get()
+        if task_id is None:
+            return suffix
+        return f"task-{task_id}-{suffix}"
+
+    def _execute(
+        self,
+        operation: str,
+        path: str,
+        selector: Optional[dict],
+        payload: Optional[dict],
+        intent: str,
+        dry_run: bool,
+        correlation_id: str,
+    ) -> str:
+        """Execute a single file operation and describe its outcome."""
+        try:
+            # Map operation names (any case) to the enum; unknown names fall
+            # through to OperationType, which rejects them
+            normalized = operation.upper()
+            operation_type = _OP_CANON.get(normalized)
+            if operation_type is None:
+                operation_type = OperationType(normalized)
+            if _CREW_LOGGER.isEnabledFor(logging.DEBUG):
+                _CREW_LOGGER.debug(
+                    f"Operation mapping: {operation} -> {operation_type.value}"
+                )
 
             # Create file operation
             file_op = FileOperation(
@@ -1356,10 +2158,10 @@ class EditorToolWrapper(BaseTool):
                 intent=intent,
                 dry_run=dry_run,
                 author="agent:implementer",
-                correlation_id=str(uuid.uuid4()),
+                correlation_id=correlation_id,
             )
 
-            crew_tool_logger.info(
+            _CREW_LOGGER.info(
                 f"Executing file operation: {operation_type.value} on {path}"
             )
 
@@ -1373,7 +2175,7 @@ class EditorToolWrapper(BaseTool):
                 and result.error
                 and "File not found" in result.error
             ):
-                crew_tool_logger.info(
+                _CREW_LOGGER.info(
                     f"Update failed due to missing file {path}; retrying as INSERT"
                 )
                 file_op.operation = OperationType.INSERT
@@ -1384,7 +2186,7 @@ class EditorToolWrapper(BaseTool):
                     file_op.operation.value if file_op else operation_type.value
                 )
                 success_msg = f"✅ Successfully executed {executed_operation} on {path}\nDiff: {result.diff}"
-                crew_tool_logger.info(
+                _CREW_LOGGER.info(
                     f"File operation successful: {executed_operation} on {path}"
                 )
                 return success_msg
@@ -1392,14 +2194,14 @@ class EditorToolWrapper(BaseTool):
                 error_msg = (
                     f"❌ Failed to execute {operation} on {path}: {result.error}"
                 )
-                crew_tool_logger.error(
+                _CREW_LOGGER.error(
                     f"File operation failed: {operation} on {path} - {result.error}"
                 )
                 return error_msg
 
         except Exception as e:
             error_msg = f"❌ Error executing {operation} on {path}: {str(e)}"
-            crew_tool_logger.error(
+            _CREW_LOGGER.error(
                 f"File operation exception: {operation} on {path} - {str(e)}"
             )
             return error_msg
@@ -1431,41 +2233,36 @@ class GitToolWrapper(BaseTool):
         branch: str = None,
     ) -> str:
         """Execute a Git operation."""
-        # Get the crew tool logger for detailed logging
-        crew_tool_logger = logging.getLogger(f"{__name__}.crewai")
-
-        crew_tool_logger.info(
+        _CREW_LOGGER.info(
             f"GitToolWrapper called: operation={operation}, message={message}, remote={remote}, branch={branch}"
         )
 
         try:
             if operation == "add":
-                crew_tool_logger.info("Executing Git add operation")
+                _CREW_LOGGER.info("Executing Git add operation")
                 result = self.git_tool.add_files()
             elif operation == "commit":
                 commit_message = message or "AI agent commit"
                 status_check = self.git_tool.get_status()
                 if status_check.success and status_check.data.get("is_clean", False):
-                    crew_tool_logger.info(
-                        "Working tree clean - skipping commit request"
-                    )
+                    _CREW_LOGGER.info("Working tree clean - skipping commit request")
                     return "No changes detected. Skipping git commit."
 
-                crew_tool_logger.info(
+                _CREW_LOGGER.info(
                     f"Executing Git commit operation with message: {commit_message}"
                 )
                 result = self.git_tool.commit(commit_message)
             elif operation == "push":
-                crew_tool_logger.info(
+                _CREW_LOGGER.info(
                     f"Executing Git push operation to {remote}/{branch}"
                 )
                 result = self.git_tool.push(remote, branch)
             elif operation == "status":
-                crew_tool_logger.info("Retrieving Git status")
+                _CREW_LOGGER.info("Retrieving Git status")
                 result = self.git_tool.get_status()
                 if result.success:
                     status_data = result.data
-                    return json.dumps(
+                    return json_codec.dumps(
                         {
                             "current_branch": status_data.get("current_branch"),
                             "staged_files": status_data.get("staged_files", []),
@@ -1476,23 +2273,23 @@ class GitToolWrapper(BaseTool):
                     )
             else:
                 error_msg = f"Unknown Git operation: {operation}"
-                crew_tool_logger.error(error_msg)
+                _CREW_LOGGER.error(error_msg)
                 return error_msg
 
             if result.success:
                 success_msg = f"Successfully executed Git {operation}: {result.data}"
-                crew_tool_logger.info(f"Git operation successful: {operation}")
+                _CREW_LOGGER.info(f"Git operation successful: {operation}")
                 return success_msg
             else:
                 error_msg = f"Failed to execute Git {operation}: {result.error}"
-                crew_tool_logger.error(
+                _CREW_LOGGER.error(
                     f"Git operation failed: {operation} - {result.error}"
                 )
                 return error_msg
 
         except Exception as e:
             error_msg = f"Error executing Git {operation}: {str(e)}"
-            crew_tool_logger.error(f"Git operation exception: {operation} - {str(e)}")
+            _CREW_LOGGER.error(f"Git operation exception: {operation} - {str(e)}")
             return error_msg
 
 
@@ -13,12 +13,56 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Read size when hashing files without loading them whole
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# hashlib.file_digest is available from Python 3.11
+_file_digest = getattr(hashlib, "file_digest", None)
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str, flags: int, engine: str = "re") -> Any:
+    """
+    Compile a selector pattern, reusing earlier compilations.
+
+    The ``re`` engine is the default. Selectors opt in to RE2 (``pip install
+    cage[perf]``) with ``"engine": "re2"``; it matches in linear time but
+    differs from ``re`` in places, e.g. ``$`` only matches at the very end of
+    the text and ``\\w``/``\\b`` are ASCII-only, so it is never chosen
+    implicitly.
+
+    Raises:
+        re.error: If the pattern is invalid for ``re``
+        ValueError: If the pattern is invalid for RE2, or RE2 is requested
+            but unavailable or given flags
+    """
+    if engine == "re":
+        return re.compile(pattern, flags)
+    if engine != "re2":
+        raise ValueError(f"Unsupported regex engine: {engine}")
+    if re2 is None:
+        raise ValueError("Regex engine 're2' requires the google-re2 package")
+    if flags:
+        raise ValueError(
+            "Regex engine 're2' does not take flags; use inline flags such as (?i)"
+        )
+    try:
+        return re2.compile(pattern)
+    except re2.error as e:
+        raise ValueError(f"Invalid regex pattern for re2: {e}") from e
+
 
 class OperationType(Enum):
     """Supported file operations."""
@@ -200,11 +244,15 @@ class EditorTool:
     def _read_file(self, file_path: Path) -> tuple[str, str]:
         """Read file content and return content and hash."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Calculate content hash
-            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            with open(file_path, "rb") as f:
+                raw = f.read()
+
+            # Hash the bytes as read, instead of re-encoding the decoded text
+            content_hash = hashlib.sha256(raw).hexdigest()
+            content = raw.decode("utf-8")
+            if "\r" in content:
+                # Same newline translation as reading in text mode
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
             return content, content_hash
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -217,12 +265,12 @@ class EditorTool:
             # Ensure directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Encoded once; the same bytes are written and hashed
+            data = content.encode("utf-8")
+            with open(file_path, "wb") as f:
+                f.write(data)
 
-            # Calculate new content hash
-            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-            return content_hash
+            return hashlib.sha256(data).hexdigest()
         except Exception as e:
             raise Exception(f"Error writing file {file_path}: {e}")
 
@@ -230,7 +278,14 @@ class EditorTool:
         """Calculate SHA256 hash of file content."""
         try:
             with open(file_path, "rb") as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                if _file_digest is not None:
+                    # Hashes straight from the file, releasing the GIL
+                    return _file_digest(f, "sha256").hexdigest()
+                # Stream in chunks so large files are never held in memory
+                digest = hashlib.sha256()
+                while chunk := f.read(_HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+                return digest.hexdigest()
         except FileNotFoundError:
             return ""
 
@@ -266,9 +321,10 @@ class EditorTool:
         """Apply regex selector to content."""
         pattern = selector.get("pattern", "")
         flags = selector.get("flags", 0)
+        engine = selector.get("engine", "re")
 
         try:
-            regex = re.compile(pattern, flags)
+            regex = _compile_regex(pattern, flags, engine)
             matches = list(regex.finditer(content))
 
             if not matches:
@@ -363,11 +419,7 @@ class EditorTool:
                     changelog_entry["text"] += f" - Failed: {result.error}"
 
                 # Update task with changelog entry
-                task = self.task_manager.load_task(task_id)
-                if task:
-                    task.changelog.append(changelog_entry)
-                    task.updated_at = datetime.now().isoformat()
-                    self.task_manager.save_task(task)
+                if self.task_manager.append_changelog(task_id, changelog_entry):
                     logger.info(f"Logged operation to task {task_id}")
                 else:
                     logger.warning(f"Task {task_id} not found for logging operation")
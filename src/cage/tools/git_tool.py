@@ -9,9 +9,15 @@ import logging
 import re
 import subprocess
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 
 class GitOperationResult:
     """Result of a Git operation."""
@@ -312,13 +318,17 @@ class GitTool:
                     success=False, error="No changes detected in the working tree"
                 )
 
+        return self._create_commit(formatted_message, author)
+
+    def _create_commit(self, message: str, author: str = None) -> GitOperationResult:
+        """Commit the staged changes and attach the new commit's info."""
         # Set author if provided
         env = None
         if author:
             env = {"GIT_AUTHOR_NAME": author, "GIT_COMMITTER_NAME": author}
 
         # Create commit
-        result = self._run_git_command(["commit", "-m", formatted_message], env=env)
+        result = self._run_git_command(["commit", "-m", message], env=env)
 
         if result.success:
             # Get commit info
@@ -565,3 +575,180 @@ class GitTool:
         except Exception as e:
             self.logger.error(f"Error reverting commits on {branch} to {to}: {e}")
             return GitOperationResult(False, error=str(e))
+
+
+class LibGit2Tool(GitTool):
+    """
+    Git operations tool backed by libgit2 for the hot paths.
+
+    Status, staging and commits run in-process through pygit2 instead of
+    spawning a git subprocess per call; everything else falls back to the
+    subprocess implementation. Commits created here do not run git hooks.
+    """
+
+    # pygit2 status flags for changes staged in the index
+    _INDEX_FLAGS = (
+        0
+        if pygit2 is None
+        else pygit2.GIT_STATUS_INDEX_NEW
+        | pygit2.GIT_STATUS_INDEX_MODIFIED
+        | pygit2.GIT_STATUS_INDEX_DELETED
+        | pygit2.GIT_STATUS_INDEX_RENAMED
+        | pygit2.GIT_STATUS_INDEX_TYPECHANGE
+    )
+    # pygit2 status flags for unstaged changes to tracked files
+    _WORKTREE_FLAGS = (
+        0
+        if pygit2 is None
+        else pygit2.GIT_STATUS_WT_MODIFIED
+        | pygit2.GIT_STATUS_WT_DELETED
+        | pygit2.GIT_STATUS_WT_RENAMED
+        | pygit2.GIT_STATUS_WT_TYPECHANGE
+    )
+
+    def __init__(self, repo_path: Path, repository: "pygit2.Repository"):
+        super().__init__(repo_path)
+        self.repository = repository
+
+    def is_git_repo(self) -> bool:
+        """Check if the current directory is a Git repository."""
+        # The repository was opened successfully when the tool was created
+        return True
+
+    def get_status(self) -> GitOperationResult:
+        """
+        Get Git repository status.
+
+        Unlike GitTool.get_status, the result has no ``commit_count``:
+        counting means walking the whole history, which would cost more than
+        the in-process status saves.
+        """
+        try:
+            repo = self.repository
+            status = repo.status()
+
+            staged_files = []
+            unstaged_files = []
+            untracked_files = []
+            status_lines = []
+            for path, flags in sorted(status.items()):
+                if flags & pygit2.GIT_STATUS_IGNORED:
+                    continue
+                if flags & pygit2.GIT_STATUS_WT_NEW and not flags & self._INDEX_FLAGS:
+                    untracked_files.append(path)
+                    status_lines.append(f"?? {path}")
+                    continue
+                staged = bool(flags & self._INDEX_FLAGS)
+                unstaged = bool(flags & self._WORKTREE_FLAGS)
+                if staged:
+                    staged_files.append(path)
+                if unstaged:
+                    unstaged_files.append(path)
+                status_lines.append(
+                    f"{'M' if staged else ' '}{'M' if unstaged else ' '} {path}"
+                )
+
+            if repo.head_is_unborn or repo.head_is_detached:
+                current_branch = ""
+            else:
+                current_branch = repo.head.shorthand
+        except pygit2.GitError as e:
+            return GitOperationResult(success=False, error=str(e))
+
+        return GitOperationResult(
+            success=True,
+            output="\n".join(status_lines),
+            data={
+                "current_branch": current_branch,
+                "staged_files": staged_files,
+                "unstaged_files": unstaged_files,
+                "untracked_files": untracked_files,
+                "is_clean": not status_lines,
+            },
+        )
+
+    def add_files(self, files: list[str] = None) -> GitOperationResult:
+        """Add files to the staging area."""
+        try:
+            repo = self.repository
+            index = repo.index
+            # add_all stages new and modified files only, so deletions of
+            # tracked files are staged separately
+            index.add_all(files or [])
+            wanted = None if files is None else set(files)
+            for path, flags in repo.status().items():
+                if flags & pygit2.GIT_STATUS_WT_DELETED and (
+                    wanted is None or path in wanted
+                ):
+                    index.remove(path)
+            index.write()
+        except pygit2.GitError as e:
+            return GitOperationResult(success=False, error=str(e))
+
+        self.logger.info(f"Added files to staging: {files or 'all'}")
+        return GitOperationResult(success=True)
+
+    def _create_commit(self, message: str, author: str = None) -> GitOperationResult:
+        """Commit the staged changes and attach the new commit's info."""
+        repo = self.repository
+        try:
+            signature = repo.default_signature
+            if author:
+                signature = pygit2.Signature(author, signature.email)
+
+            tree = repo.index.write_tree()
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            oid = repo.create_commit(
+                "HEAD", signature, signature, message, tree, parents
+            )
+            commit = repo[oid]
+
+            if parents:
+                stats = repo.diff(parents[0], oid).stats
+            else:
+                stats = commit.tree.diff_to_tree(swap=True).stats
+        except (pygit2.GitError, KeyError) as e:
+            # KeyError: no user.name/user.email configured
+            return GitOperationResult(success=False, error=str(e))
+
+        commit_tz = timezone(timedelta(minutes=commit.author.offset))
+        date_str = datetime.fromtimestamp(commit.author.time, commit_tz).strftime(
+            "%Y-%m-%d %H:%M:%S %z"
+        )
+        sha = str(oid)
+        title = commit.message.splitlines()[0]
+        self.logger.info(f"Created commit: {sha[:8]}")
+
+        return GitOperationResult(
+            success=True,
+            output=f"[{repo.head.shorthand} {sha[:7]}] {title}",
+            data={
+                "sha": sha,
+                "title": title,
+                "author": commit.author.name,
+                "email": commit.author.email,
+                "date": date_str,
+                "timestamp": str(commit.commit_time),
+                "files_changed": stats.files_changed,
+                "insertions": stats.insertions,
+                "deletions": stats.deletions,
+            },
+        )
+
+
+def make_git_tool(repo_path: Path) -> GitTool:
+    """
+    Create the fastest available Git tool for a repository.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        A LibGit2Tool when pygit2 is installed and the path is a Git
+        repository, otherwise a subprocess-based GitTool
+    """
+    if pygit2 is not None:
+        git_dir = pygit2.discover_repository(str(repo_path))
+        if git_dir is not None:
+            return LibGit2Tool(repo_path, pygit2.Repository(git_dir))
+    return GitTool(repo_path)
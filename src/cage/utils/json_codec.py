@@ -0,0 +1,126 @@
+"""
+Fast JSON encoding helpers.
+
+Uses orjson when it is installed (``pip install cage[perf]``) and falls back
+to the standard library ``json`` module otherwise, so callers get equivalent
+output either way.
+"""
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(
+    obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Optional fallback serializer for unsupported types
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def dumps(
+    obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Optional fallback serializer for unsupported types
+
+    Returns:
+        The JSON document as a string
+    """
+    return dumps_bytes(obj, indent=indent, default=default).decode("utf-8")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The data is written to a sibling temporary file and then renamed over the
+    target, so concurrent readers never observe a partially written file.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    # Unique per writer, so concurrent writers of one file never share a
+    # temporary file
+    tmp_path = path.with_name(
+        f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            # Unbuffered: normally a single write() syscall for the payload
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json_atomic(
+    path: Path,
+    obj: Any,
+    indent: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """
+    Serialize an object and write it to a JSON file atomically.
+
+    Args:
+        path: Destination file path
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Optional fallback serializer for unsupported types
+    """
+    atomic_write_bytes(path, dumps_bytes(obj, indent=indent, default=default))
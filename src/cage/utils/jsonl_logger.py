@@ -5,15 +5,18 @@ This module provides JSONL (JSON Lines) logging with structured format
 for file API services. Each log entry is a single JSON object on its own line.
 """
 
-import json
+import atexit
 import logging
 import os
+import threading
 import time
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import MemoryHandler, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Any
 
+from . import json_codec
+
 # Import request ID context
 try:
     from .request_id_middleware import get_current_request_id
@@ -71,8 +74,9 @@ class JSONLFormatter(logging.Formatter):
         if record.funcName:
             log_entry["func"] = record.funcName
 
-        # Convert to JSON string (one line)
-        return json.dumps(log_entry, ensure_ascii=False)
+        # Convert to JSON string (one line); structured data is encoded once
+        # here rather than pre-serialized into the message
+        return json_codec.dumps(log_entry, default=str)
 
 
 class JSONLHandler(TimedRotatingFileHandler):
@@ -132,8 +136,54 @@ class JSONLHandler(TimedRotatingFileHandler):
             self.stream = self._open()
 
 
+class BufferedJSONLHandler(MemoryHandler):
+    """
+    Buffering wrapper that batches records into a single write.
+
+    Records are written to the target handler when the buffer is full, when
+    an ERROR or higher record arrives, on a periodic timer (so tailing the
+    log file still works), and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = 512,
+        flush_interval: float = 0.25,
+    ):
+        super().__init__(
+            capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True
+        )
+        # Level checks happen before buffering; the target never sees them
+        self.setLevel(target.level)
+        self.flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="jsonl-log-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self) -> None:
+        """Flush buffered records every ``flush_interval`` seconds."""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flush timer, flush and close the buffer and its target."""
+        self._stop.set()
+        atexit.unregister(self.flush)
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
 def setup_jsonl_logger(
-    service: str, log_dir: str = "logs", level: int = logging.INFO
+    service: str,
+    log_dir: str = "logs",
+    level: int = logging.INFO,
+    buffer_capacity: int = 0,
 ) -> logging.Logger:
     """
     Set up a JSONL logger for a specific service.
@@ -142,6 +192,8 @@ def setup_jsonl_logger(
         service: Service name (e.g., 'files-api', 'rag-api', 'lock-api')
         log_dir: Base log directory (default: 'logs')
         level: Logging level (default: INFO)
+        buffer_capacity: Buffer up to this many records per write; 0 writes
+            every record immediately (default: 0)
 
     Returns:
         Configured logger instance
@@ -149,11 +201,16 @@ def setup_jsonl_logger(
     logger = logging.getLogger(f"cage.{service}")
     logger.setLevel(level)
 
-    # Clear any existing handlers to avoid duplicates
+    # Clear any existing handlers to avoid duplicates, closing them so
+    # buffered records are written out first
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Add JSONL file handler
-    file_handler = JSONLHandler(log_dir, service, level)
+    file_handler: logging.Handler = JSONLHandler(log_dir, service, level)
+    if buffer_capacity > 0:
+        file_handler = BufferedJSONLHandler(file_handler, capacity=buffer_capacity)
     logger.addHandler(file_handler)
 
     # Prevent propagation to avoid duplicate logs
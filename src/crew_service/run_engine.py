@@ -215,26 +215,12 @@ class RunEngine:
 
             logger.info(f"Task {task_id} created successfully")
 
-            # Phase 1: Create plan
-            logger.info(f"Phase 1: Creating plan for task {task_id}")
-            plan_result = self.crew_tool.create_plan(task_id, {"strategy": strategy})
-
-            if plan_result.get("status") != "success":
-                raise ValueError(f"Plan creation failed: {plan_result.get('error')}")
-
-            run_id_from_plan = plan_result.get("run_id")
-            logger.info(f"Plan created successfully with run_id: {run_id_from_plan}")
-
-            # Check for cancellation after planning
-            if run.id in self._cancelled_runs:
-                run.status = RunState.CANCELLED.value
-                run.finished_at = datetime.utcnow()
-                self._cancelled_runs.discard(run.id)
-                return run
-
-            # Phase 2: Apply plan (implement → review → commit)
-            logger.info(f"Phase 2: Applying plan for task {task_id}")
-            apply_result = self.crew_tool.apply_plan(task_id, run_id_from_plan)
+            # Plan and apply in one crew pass (plan → implement → review → commit)
+            logger.info(f"Planning and applying task {task_id}")
+            apply_result = await self.crew_tool.create_and_apply(
+                task_id, {"strategy": strategy}
+            )
+            run_id_from_plan = apply_result.get("run_id")
 
             if apply_result.get("status") != "success":
                 raise ValueError(